@@ -5,14 +5,34 @@ A library that provides Option and Result types similar to Rust, with automatic
 logging of errors using loguru, and configuration management via confection.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 __version__ = "0.2.0"
 
-# Re-export main types
-# Import modules for namespaced factory functions
-from . import option, result, utilities
-from .config import configure, get_config, reset_config
-from .option import Nothing, Option, Some
-from .result import Err, Ok, Result
+# Public names are resolved lazily (PEP 562) so that importing logerr doesn't
+# pay for submodules the caller never touches. Maps each exported name to the
+# submodule it lives in; submodules themselves map to None.
+_LAZY_EXPORTS: dict[str, str | None] = {
+    # Re-export main types
+    "Err": "result",
+    "Nothing": "option",
+    "Ok": "result",
+    "Option": "option",
+    "Result": "result",
+    "Some": "option",
+    # Configuration
+    "configure": "config",
+    "get_config": "config",
+    "reset_config": "config",
+    # Modules for namespaced factory functions
+    "config": None,
+    "option": None,
+    "result": None,
+    "utilities": None,
+}
 
 __all__ = [
     "Err",
@@ -28,3 +48,22 @@ __all__ = [
     "result",
     "utilities",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule backing ``name`` on first access and cache it."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name = _LAZY_EXPORTS[name]
+    if module_name is None:
+        value: Any = importlib.import_module(f".{name}", __name__)
+    else:
+        value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 """Type stubs for logerr main module."""
 
+from . import config as config
 from . import option as option
 from . import result as result
 from . import utilities as utilities
@@ -7,6 +7,7 @@ For advanced configuration features, see logerr.recipes.config
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -14,7 +15,14 @@ if TYPE_CHECKING:
     from .result import Result
 
 
-@dataclass
+# Log levels accepted by configure(); shared with logerr.recipes.config and
+# logerr.utilities so there's a single source of truth
+_VALID_LEVELS: frozenset[str] = frozenset(
+    {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+)
+
+
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Basic configuration for error logging behavior."""
 
@@ -23,22 +31,29 @@ class LoggingConfig:
     level: str = "ERROR"
 
 
-# Global configuration instance
-_config: LoggingConfig | None = None
+# Shared default configuration; LoggingConfig is frozen, so reset_config()
+# can hand out this one instance instead of allocating a fresh one each time
+_DEFAULT_CONFIG: LoggingConfig = LoggingConfig()
+
+# Global configuration instance, created eagerly so readers never need a
+# None check on the logging hot path
+_config: LoggingConfig = _DEFAULT_CONFIG
+
+# Mirror of _config.enabled, kept in sync by every writer of _config, so the
+# per-Err/Nothing should_log() check is a single global bool load
+_logging_enabled: bool = _config.enabled
 
 
 def get_config() -> LoggingConfig:
     """Get the current logging configuration."""
-    global _config
-    if _config is None:
-        _config = LoggingConfig()
     return _config
 
 
 def reset_config() -> None:
     """Reset configuration to defaults."""
-    global _config
-    _config = LoggingConfig()
+    global _config, _logging_enabled
+    _config = _DEFAULT_CONFIG
+    _logging_enabled = _config.enabled
 
 
 def configure(
@@ -63,33 +78,39 @@ def configure(
     # Import at runtime to avoid circular import
     from .result import Err, Ok
 
-    global _config
-    current = get_config()
+    global _config, _logging_enabled
+    current = _config
 
     # Validate log level if provided
-    if level is not None:
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if level not in valid_levels:
-            return Err.from_value(
-                ValueError(
-                    f"Invalid log level '{level}'. Must be one of: {valid_levels}"
-                )
+    if level is not None and level not in _VALID_LEVELS:
+        return Err.from_value(
+            ValueError(
+                f"Invalid log level '{level}'. Must be one of: {sorted(_VALID_LEVELS)}"
             )
+        )
+
+    # Nothing to change - keep the current config object
+    if (enabled is None or enabled == current.enabled) and (
+        level is None or level == current.level
+    ):
+        return Ok(None)
 
     # Apply configuration
     _config = LoggingConfig(
         enabled=enabled if enabled is not None else current.enabled,
-        level=level if level is not None else current.level,
+        # Interned so downstream comparisons can short-circuit on identity
+        level=sys.intern(level) if level is not None else current.level,
     )
+    _logging_enabled = _config.enabled
 
     return Ok(None)
 
 
 def should_log() -> bool:
     """Check if logging is enabled."""
-    return get_config().enabled
+    return _logging_enabled
 
 
 def get_log_level() -> str:
     """Get the current log level."""
-    return get_config().level
+    return _config.level
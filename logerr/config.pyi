@@ -8,7 +8,9 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from .result import Result
 
-@dataclass
+_VALID_LEVELS: frozenset[str]
+
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     """Basic configuration for error logging behavior."""
 
@@ -7,22 +7,21 @@ through loguru, configurable via confection.
 
 from __future__ import annotations
 
-import inspect
-from abc import ABC, abstractmethod
+import sys
 from collections.abc import Callable, Iterable, Iterator
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 from loguru import logger
 
 from .config import get_log_level, should_log
-from .result import Err, Ok, Result
+from .result import Err, Ok, Result, _file_name
 
 T = TypeVar("T")
 U = TypeVar("U")
 E = TypeVar("E")
 
 
-class Option[T](ABC):
+class Option[T]:
     """A type that represents an optional value: either Some(T) or Nothing.
 
     Option<T> is similar to Rust's Option type, providing a way to handle
@@ -54,7 +53,8 @@ class Option[T](ABC):
         'HELLO'
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def is_some(self) -> bool:
         """Check if this Option contains a value.
 
@@ -67,9 +67,8 @@ class Option[T](ABC):
             >>> Nothing.empty().is_some()
             False
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def is_nothing(self) -> bool:
         """Check if this Option contains no value.
 
@@ -82,9 +81,8 @@ class Option[T](ABC):
             >>> Nothing.empty().is_nothing()
             True
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T:
         """Extract the contained value, raising an exception if this is Nothing.
 
@@ -101,9 +99,8 @@ class Option[T](ABC):
             Traceback (most recent call last):
             ValueError: Called unwrap on Nothing: Empty option
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T) -> T:
         """Extract the contained value or return a default.
 
@@ -119,9 +116,8 @@ class Option[T](ABC):
             >>> Nothing.empty().unwrap_or(0)
             0
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or_else(self, f: Callable[[], T]) -> T:
         """Extract the contained value or compute one from a closure.
 
@@ -137,9 +133,8 @@ class Option[T](ABC):
             >>> Nothing.empty().unwrap_or_else(lambda: 99)
             99
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def map[U](self, f: Callable[[T], U]) -> Option[U]:
         """Transform the contained value if present.
 
@@ -161,9 +156,8 @@ class Option[T](ABC):
             >>> Nothing.empty().map(lambda x: x * 2)
             Nothing('Empty option')
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def then[U](self, f: Callable[[T], Option[U]]) -> Option[U]:
         """Chain Option-returning operations (also known as flatmap).
 
@@ -187,9 +181,8 @@ class Option[T](ABC):
             >>> Some(0).then(safe_divide)  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def or_else(self, f: Callable[[], Option[T]]) -> Option[T]:
         """Chain Option-returning operations on the Nothing case.
 
@@ -213,9 +206,8 @@ class Option[T](ABC):
             >>> Nothing.empty().unwrap_or(99)
             99
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def or_default(self, default: T) -> Option[T]:
         """Return Some(default) if this is Nothing, otherwise return this Some.
 
@@ -233,9 +225,8 @@ class Option[T](ABC):
             >>> Nothing.empty().or_default(99)
             Some(99)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def filter(self, predicate: Callable[[T], bool]) -> Option[T]:
         """Keep the value only if it satisfies a predicate.
 
@@ -255,9 +246,8 @@ class Option[T](ABC):
             >>> Some(5).filter(lambda x: x > 30)  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def ok_or(self, err: E) -> Result[T, E]:
         """Convert this Option into a Result, using a fixed error for Nothing.
 
@@ -273,9 +263,8 @@ class Option[T](ABC):
             >>> Nothing.empty().ok_or("missing")  # doctest: +ELLIPSIS
             Err(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def ok_or_else(self, err_fn: Callable[[], E]) -> Result[T, E]:
         """Convert this Option into a Result, computing the error lazily for Nothing.
 
@@ -295,9 +284,8 @@ class Option[T](ABC):
             >>> Nothing.empty().ok_or_else(lambda: "missing")  # doctest: +ELLIPSIS
             Err(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __iter__(self) -> Iterator[T]:
         """Iterate over the contained value, 0 or 1 times.
 
@@ -314,9 +302,8 @@ class Option[T](ABC):
             >>> list(Nothing.empty())
             []
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def zip[U](self, other: Option[U]) -> Option[tuple[T, U]]:
         """Combine this Option with another into an Option of a tuple.
 
@@ -332,9 +319,8 @@ class Option[T](ABC):
             >>> Some(1).zip(Nothing.empty())  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def flatten(self: Option[Option[T]]) -> Option[T]:
         """Flatten a nested Option by one level.
 
@@ -345,9 +331,8 @@ class Option[T](ABC):
             >>> Some(Some(42)).flatten()
             Some(42)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def and_[U](self, other: Option[U]) -> Option[U]:
         """Return `other` if this is Some, otherwise Nothing.
 
@@ -363,9 +348,8 @@ class Option[T](ABC):
             >>> Nothing.empty().and_(Some("a"))  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def or_(self, other: Option[T]) -> Option[T]:
         """Return this Option if Some, otherwise `other`.
 
@@ -381,9 +365,8 @@ class Option[T](ABC):
             >>> Nothing.empty().or_(Some(2))
             Some(2)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __hash__(self) -> int:
         """Hash this Option, consistent with __eq__.
 
@@ -395,9 +378,8 @@ class Option[T](ABC):
             >>> hash(Some(1)) == hash(Some(1))
             True
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __bool__(self) -> bool:
         """Return whether this Option is truthy.
 
@@ -410,9 +392,8 @@ class Option[T](ABC):
             >>> bool(Nothing.empty())
             False
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __len__(self) -> int:
         """Return the number of contained values (0 or 1).
 
@@ -427,9 +408,8 @@ class Option[T](ABC):
             >>> len(Nothing.empty())
             0
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __contains__(self, item: object) -> bool:
         """Check whether `item` equals the contained Some value.
 
@@ -445,9 +425,8 @@ class Option[T](ABC):
             >>> 42 in Nothing.empty()
             False
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __and__[U](self, other: Option[U]) -> Option[U]:
         """Thin delegate to and_() - return `other` if this is Some, otherwise Nothing.
 
@@ -463,9 +442,8 @@ class Option[T](ABC):
             >>> Nothing.empty() & Some("a")  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __or__(self, other: Option[T]) -> Option[T]:
         """Thin delegate to or_() - return this Option if Some, otherwise `other`.
 
@@ -481,26 +459,19 @@ class Option[T](ABC):
             >>> Nothing.empty() | Some(2)
             Some(2)
         """
-        pass
+        raise NotImplementedError
 
     @classmethod
     def from_nullable(cls, value: T | None) -> Option[T]:
         """Create an Option from a potentially None value."""
-        from . import option as option_module
-
-        return option_module.from_nullable(value)
+        # The module-level function is defined below in this same module, so
+        # it's already a global by call time - no per-call self-import needed
+        return from_nullable(value)
 
     @classmethod
     def of(cls, f: Callable[[], T | None]) -> Option[T]:
         """Create an Option from a callable that might return None."""
-        try:
-            result = f()
-            if result is not None:
-                return Some(result)
-            else:
-                return Nothing.from_none("Callable returned None")
-        except Exception as e:
-            return Nothing.from_exception(e)
+        return of(f)
 
     @classmethod
     def from_predicate(
@@ -511,11 +482,7 @@ class Option[T](ABC):
         error_message: str | None = None,
     ) -> Option[T]:
         """Create an Option based on whether a predicate is satisfied."""
-        from . import option as option_module
-
-        return option_module.from_predicate(
-            value, predicate, error_message=error_message
-        )
+        return from_predicate(value, predicate, error_message=error_message)
 
     @classmethod
     def sequence(cls, items: Iterable[Option[T]]) -> Option[list[T]]:
@@ -601,6 +568,8 @@ class Some[T](Option[T]):
         Some(5)
     """
 
+    # _hash is filled in lazily by the first __hash__ call
+    __slots__ = ("_hash", "_value")
     __match_args__ = ("_value",)
 
     def __init__(self, value: T) -> None:
@@ -677,7 +646,12 @@ class Some[T](Option[T]):
         return or_option(self, other)
 
     def __hash__(self) -> int:
-        return hash((Some, self._value))
+        # Some is immutable, so the hash is computed once and reused
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((Some, self._value))
+            return self._hash
 
     def __bool__(self) -> bool:
         return True
@@ -704,36 +678,46 @@ class Some[T](Option[T]):
         return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
-        match other:
-            case Some(other_value):
-                try:
-                    result = self._value < other_value
-                    return bool(result)
-                except TypeError:
-                    return NotImplemented
-            case Nothing():
-                return False  # Some is always greater than Nothing
-            case _:
+        if isinstance(other, Some):
+            try:
+                return bool(self._value < other._value)
+            except TypeError:
                 return NotImplemented
+        if isinstance(other, Nothing):
+            return False  # Some is always greater than Nothing
+        return NotImplemented
 
     def __le__(self, other: object) -> bool:
-        return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, Some):
+            try:
+                return bool(self._value <= other._value)
+            except TypeError:
+                # Values that only define == and < still order as before
+                return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, Nothing):
+            return False  # Some is always greater than Nothing
+        return NotImplemented
 
     def __gt__(self, other: object) -> bool:
-        match other:
-            case Some(other_value):
-                try:
-                    result = self._value > other_value
-                    return bool(result)
-                except TypeError:
-                    return NotImplemented
-            case Nothing():
-                return True  # Some is always greater than Nothing
-            case _:
+        if isinstance(other, Some):
+            try:
+                return bool(self._value > other._value)
+            except TypeError:
                 return NotImplemented
+        if isinstance(other, Nothing):
+            return True  # Some is always greater than Nothing
+        return NotImplemented
 
     def __ge__(self, other: object) -> bool:
-        return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Some):
+            try:
+                return bool(self._value >= other._value)
+            except TypeError:
+                # Values that only define == and > still order as before
+                return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Nothing):
+            return True  # Some is always greater than Nothing
+        return NotImplemented
 
 
 class Nothing[T](Option[T]):
@@ -766,8 +750,13 @@ class Nothing[T](Option[T]):
         Nothing('Empty option')
     """
 
+    __slots__ = ("_exception", "_reason_text")
     __match_args__ = ("_reason",)
 
+    # Shared instance handed out by empty(); Nothing is immutable, so every
+    # caller can safely get the same object
+    _EMPTY: ClassVar[Nothing[Any] | None] = None
+
     def __init__(
         self,
         reason: str = "No value",
@@ -784,32 +773,50 @@ class Nothing[T](Option[T]):
                 this Nothing was constructed via from_exception(). Preserved
                 so unwrap() can re-raise the original exception.
         """
-        self._reason = reason
+        self._reason_text: str | None = reason
         self._exception = _exception
-        if not _skip_logging:
+        # Logging is the cold path: with it disabled, construction is just
+        # the attribute writes above
+        if not _skip_logging and should_log():
             self._log_nothing()
 
-    def _log_nothing(self) -> None:
-        """Log the Nothing case using configured logging settings."""
-        # Check if logging is enabled globally
-        if not should_log():
-            return
-
-        # Get the calling frame to capture basic context
-        frame = inspect.currentframe()
-        caller_frame = None
+    @property
+    def _reason(self) -> str:
+        """Why the value is absent.
 
-        if frame and frame.f_back and frame.f_back.f_back:
-            caller_frame = frame.f_back.f_back
+        from_exception() leaves this unset when logging is disabled, so the
+        exception is only formatted if something actually reads the reason.
+        """
+        reason = self._reason_text
+        if reason is None:
+            reason = self._reason_text = f"Exception: {self._exception}"
+        return reason
 
-        # Capture basic context
-        context: dict[str, Any] = {}
-        if caller_frame:
-            from pathlib import Path
+    def _log_nothing(self) -> None:
+        """Log the Nothing case using configured logging settings.
 
-            context["function"] = caller_frame.f_code.co_name
-            context["file"] = Path(caller_frame.f_code.co_filename).name
-            context["line"] = caller_frame.f_lineno
+        Only called from __init__ once should_log() has passed.
+        """
+        # Get the calling frame to capture basic context: skip this method
+        # and __init__ with a single C call rather than walking inspect frames
+        try:
+            caller_frame = sys._getframe(2)
+        except ValueError:
+            caller_frame = None
+
+        # Bind the caller's context directly from the frame, rather than
+        # filling a dict and reading it back for the message
+        if caller_frame is None:
+            location = "<?>:?"
+            bound_logger = logger
+        else:
+            code = caller_frame.f_code
+            location = f"{code.co_name}:{caller_frame.f_lineno}"
+            bound_logger = logger.bind(
+                function=code.co_name,
+                file=_file_name(code.co_filename),
+                line=caller_frame.f_lineno,
+            )
 
         # For Nothing cases, use WARNING level by default (less severe than ERROR)
         log_level = get_log_level()
@@ -817,11 +824,10 @@ class Nothing[T](Option[T]):
             log_level = "WARNING"
 
         # Build simple log message
-        location = f"{context.get('function', '<?>')}:{context.get('line', '?')}"
         message = f"Option Nothing in {location} - {self._reason}"
 
         # Log at the configured level
-        logger.bind(**context).log(log_level, message)
+        bound_logger.log(log_level, message)
 
     @classmethod
     def from_exception(cls, exception: Exception) -> Nothing[T]:
@@ -844,6 +850,12 @@ class Nothing[T](Option[T]):
             >>> option.is_nothing()
             True
         """
+        if not should_log():
+            # Nothing to log, so skip __init__ and defer formatting the reason
+            nothing: Nothing[T] = cls.__new__(cls)
+            nothing._reason_text = None
+            nothing._exception = exception
+            return nothing
         return cls(f"Exception: {exception}", _exception=exception)
 
     @classmethod
@@ -897,7 +909,9 @@ class Nothing[T](Option[T]):
             >>> option.unwrap_or("default")
             'default'
         """
-        return cls("Empty option", _skip_logging=True)
+        if cls._EMPTY is None:
+            cls._EMPTY = cls("Empty option", _skip_logging=True)
+        return cls._EMPTY
 
     def is_some(self) -> bool:
         return False
@@ -923,10 +937,10 @@ class Nothing[T](Option[T]):
             raise ValueError(f"unwrap_or_else function failed: {e}") from e
 
     def map[U](self, f: Callable[[T], U]) -> Option[U]:
-        return Nothing(self._reason, _skip_logging=True, _exception=self._exception)
+        return self  # type: ignore[return-value]
 
     def then[U](self, f: Callable[[T], Option[U]]) -> Option[U]:
-        return Nothing(self._reason, _skip_logging=True, _exception=self._exception)
+        return self  # type: ignore[return-value]
 
     def or_else(self, f: Callable[[], Option[T]]) -> Option[T]:
         return f()
@@ -935,7 +949,7 @@ class Nothing[T](Option[T]):
         return Some(default)
 
     def filter(self, predicate: Callable[[T], bool]) -> Option[T]:
-        return Nothing(self._reason, _skip_logging=True, _exception=self._exception)
+        return self
 
     def ok_or(self, err: E) -> Result[T, E]:
         return Err(err)
@@ -994,37 +1008,37 @@ class Nothing[T](Option[T]):
         return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
-        match other:
-            case Some():
-                return True  # Nothing is always less than Some
-            case Nothing():
-                return False  # Nothing values are equal in ordering
-            case _:
-                return NotImplemented
+        if isinstance(other, Some):
+            return True  # Nothing is always less than Some
+        if isinstance(other, Nothing):
+            return False  # Nothing values are equal in ordering
+        return NotImplemented
 
     def __le__(self, other: object) -> bool:
-        match other:
-            case Nothing():
-                return True  # Nothing values are equal in ordering
-            case _:
-                return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, (Some, Nothing)):
+            return True  # Nothing is less than Some and equal to Nothing
+        return NotImplemented
 
     def __gt__(self, other: object) -> bool:
-        match other:
-            case Some() | Nothing():
-                return False  # Nothing is never greater than anything
-            case _:
-                return NotImplemented
+        if isinstance(other, (Some, Nothing)):
+            return False  # Nothing is never greater than anything
+        return NotImplemented
 
     def __ge__(self, other: object) -> bool:
-        match other:
-            case Nothing():
-                return True  # Nothing values are equal in ordering
-            case _:
-                return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Nothing):
+            return True  # Nothing values are equal in ordering
+        if isinstance(other, Some):
+            return False  # Nothing is never greater than Some
+        return NotImplemented
 
 
 # Factory functions for creating Options
+
+# Shared result for from_nullable(None) while logging is disabled: with no log
+# record to emit, every such Nothing is indistinguishable, so skip allocating
+_NULLABLE_NOTHING: Nothing[Any] = Nothing("Value was None", _skip_logging=True)
+
+
 def of[T](f: Callable[[], T | None]) -> Option[T]:
     """Execute a callable and return Some(result) or Nothing.
 
@@ -1061,14 +1075,14 @@ def of[T](f: Callable[[], T | None]) -> Option[T]:
         >>> option.unwrap_or("default_value")
         'default_value'
     """
+    # Only the caller's callable is guarded; building the Option is not
     try:
         result = f()
-        if result is not None:
-            return Some(result)
-        else:
-            return Nothing.from_none("Callable returned None")
     except Exception as e:
         return Nothing.from_exception(e)
+    if result is not None:
+        return Some(result)
+    return Nothing.from_none("Callable returned None")
 
 
 def from_nullable[T](value: T | None) -> Option[T]:
@@ -1102,8 +1116,9 @@ def from_nullable[T](value: T | None) -> Option[T]:
     """
     if value is not None:
         return Some(value)
-    else:
-        return Nothing.from_none()
+    if not should_log():
+        return _NULLABLE_NOTHING
+    return Nothing.from_none()
 
 
 def from_predicate(
@@ -1150,14 +1165,14 @@ def from_predicate(
         >>> option.is_nothing()
         True
     """
+    # Only the predicate (and its truthiness) is guarded
     try:
-        if predicate(value):
-            return Some(value)
-        else:
-            message = error_message or f"Value {value} failed predicate"
-            return Nothing.from_filter(message)
+        passed = bool(predicate(value))
     except Exception as e:
         return Nothing.from_exception(e)
+    if passed:
+        return Some(value)
+    return Nothing.from_filter(error_message or f"Value {value} failed predicate")
 
 
 def predicate_filter[T](
@@ -32,6 +32,12 @@ Usage:
     df_result = from_mongo(db.users, {}, schema=schema)
 """
 
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from typing import Any
+
 # Always available modules
 from . import config
 
@@ -43,15 +49,15 @@ try:
 except ImportError:
     dataframes_available = False
 
-# Import retry module when tenacity is available
-try:
-    from . import retry
-
+# retry is imported lazily (PEP 562) on first access, so `import logerr.recipes`
+# doesn't pay for tenacity unless retry is actually used. Only its availability
+# is checked up front, which locates tenacity without executing it.
+if importlib.util.find_spec("tenacity") is not None:
     if dataframes_available:
         __all__ = ["config", "dataframes", "retry"]
     else:
         __all__ = ["config", "retry"]
-except ImportError:
+else:
     # Provide helpful error message when tenacity is missing for retry
     import warnings
 
@@ -72,3 +78,16 @@ if not dataframes_available:
         ImportWarning,
         stacklevel=2,
     )
+
+
+def __getattr__(name: str) -> Any:
+    """Import the retry submodule on first access and cache it."""
+    if name == "retry" and name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -7,17 +7,20 @@ using confection. This extends the basic configuration available in the core lib
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields, replace
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
-from confection import Config
+from ..config import _VALID_LEVELS
 
 if TYPE_CHECKING:
     from ..result import Result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AdvancedLoggingConfig:
     """Advanced configuration for error logging behavior."""
 
@@ -26,8 +29,8 @@ class AdvancedLoggingConfig:
     level: str = "ERROR"
     format: str | None = None
 
-    # Per-library settings
-    libraries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    # Per-library settings, stored read-only (see __post_init__)
+    libraries: Mapping[str, Mapping[str, Any]] = field(default_factory=dict)
 
     # Context capture settings
     capture_function_name: bool = True
@@ -35,23 +38,72 @@ class AdvancedLoggingConfig:
     capture_lineno: bool = True
     capture_locals: bool = False
 
+    def __post_init__(self) -> None:
+        # Lookups go through state derived from this table when the config is
+        # installed, so later edits to it would silently go stale; store a
+        # read-only copy so they fail loudly instead
+        object.__setattr__(
+            self,
+            "libraries",
+            MappingProxyType(
+                {
+                    name: MappingProxyType(dict(lib))
+                    for name, lib in self.libraries.items()
+                }
+            ),
+        )
+
+
+# Fields configure_advanced() copies straight from its config dict; "level" is
+# validated and "libraries" merged, so both are handled separately
+_PLAIN_FIELDS: frozenset[str] = frozenset(
+    f.name
+    for f in fields(AdvancedLoggingConfig)
+    if f.name not in ("level", "libraries")
+)
+
+# Global advanced configuration instance, created eagerly so readers never
+# need a None check on the logging hot path
+_advanced_config: AdvancedLoggingConfig = AdvancedLoggingConfig()
+
+# Mirror of _advanced_config.enabled so should_log_for_library() can bail out
+# before touching the per-library table when logging is globally disabled
+_logging_enabled: bool = _advanced_config.enabled
+
+# Effective (enabled, level) per configured library with the global settings
+# merged in, rebuilt whenever _advanced_config is replaced; libraries without
+# an entry resolve to _resolved_default
+_resolved_libs: dict[str, tuple[bool, str]] = {}
+_resolved_default: tuple[bool, str] = (_advanced_config.enabled, _advanced_config.level)
 
-# Global advanced configuration instance
-_advanced_config: AdvancedLoggingConfig | None = None
+# Parsed "logerr" sections of confection files, keyed by path and stamped
+# with the (mtime_ns, size) they were read at
+_confection_cache: dict[str, tuple[tuple[int, int], dict[str, Any] | None]] = {}
 
 
 def get_advanced_config() -> AdvancedLoggingConfig:
     """Get the current advanced logging configuration."""
-    global _advanced_config
-    if _advanced_config is None:
-        _advanced_config = AdvancedLoggingConfig()
     return _advanced_config
 
 
+def _install(config: AdvancedLoggingConfig) -> None:
+    """Make ``config`` current and rebuild the state derived from it."""
+    global _advanced_config, _logging_enabled, _resolved_libs, _resolved_default
+    _advanced_config = config
+    _logging_enabled = config.enabled
+    _resolved_default = (config.enabled, config.level)
+    _resolved_libs = {
+        name: (
+            config.enabled and bool(lib.get("enabled", True)),
+            sys.intern(str(lib.get("level", config.level))),
+        )
+        for name, lib in config.libraries.items()
+    }
+
+
 def reset_advanced_config() -> None:
     """Reset advanced configuration to defaults."""
-    global _advanced_config
-    _advanced_config = AdvancedLoggingConfig()
+    _install(AdvancedLoggingConfig())
 
 
 def configure_advanced(config_dict: dict[str, Any]) -> Result[None, ValueError]:
@@ -84,38 +136,48 @@ def configure_advanced(config_dict: dict[str, Any]) -> Result[None, ValueError]:
         >>> configure_advanced(config)  # doctest: +SKIP
     """
     # Import at runtime to avoid circular import
-    from ..result import Result
+    from ..result import Err, Ok
+
+    current = _advanced_config
+    level = config_dict.get("level", current.level)
+    if not isinstance(level, str) or level not in _VALID_LEVELS:
+        return Err.from_value(
+            ValueError(
+                f"Invalid log level '{level}'. Must be one of: {sorted(_VALID_LEVELS)}"
+            )
+        )
 
-    global _advanced_config
-
-    # Use functional API pipeline for validation and configuration creation
-    level = config_dict.get("level", get_advanced_config().level)
-    valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-
-    def _create_and_set_config() -> None:
-        """Create new configuration from dictionary and set it globally."""
-        global _advanced_config
-        current = get_advanced_config()
-        _advanced_config = AdvancedLoggingConfig(
-            enabled=config_dict.get("enabled", current.enabled),
-            level=level,
-            format=config_dict.get("format", current.format),
-            libraries={**current.libraries, **config_dict.get("libraries", {})},
-            capture_function_name=config_dict.get(
-                "capture_function_name", current.capture_function_name
-            ),
-            capture_filename=config_dict.get(
-                "capture_filename", current.capture_filename
-            ),
-            capture_lineno=config_dict.get("capture_lineno", current.capture_lineno),
-            capture_locals=config_dict.get("capture_locals", current.capture_locals),
+    # One pass over the keys the caller actually supplied, however sparse
+    overrides = {k: v for k, v in config_dict.items() if k in _PLAIN_FIELDS}
+    libraries = config_dict.get("libraries", {})
+    if not isinstance(libraries, Mapping):
+        return Err.from_value(
+            ValueError(
+                f"Invalid libraries {libraries!r}. Must be a mapping of library "
+                "names to settings"
+            )
         )
 
-    return Result.from_predicate(
-        level,
-        lambda lvl: lvl in valid_levels,
-        ValueError(f"Invalid log level '{level}'. Must be one of: {valid_levels}"),
-    ).then(lambda _: Result.of(_create_and_set_config).map_err(ValueError))
+    # Nothing to change - keep the current config (and the resolved table)
+    if (
+        level == current.level
+        and all(getattr(current, k) == v for k, v in overrides.items())
+        and all(current.libraries.get(k) == v for k, v in libraries.items())
+    ):
+        return Ok(None)
+
+    try:
+        new_config = replace(
+            current,
+            level=sys.intern(level),
+            libraries={**current.libraries, **libraries},
+            **overrides,
+        )
+    except Exception as e:
+        return Err.from_value(ValueError(e))
+
+    _install(new_config)
+    return Ok(None)
 
 
 def configure_from_confection(config_path: str) -> Result[None, Exception]:
@@ -134,29 +196,47 @@ def configure_from_confection(config_path: str) -> Result[None, Exception]:
         >>> configure_from_confection("config.cfg")  # doctest: +SKIP
     """
     # Import at runtime to avoid circular import
-    from ..option import Option
-    from ..result import Ok, Result
-
-    # Use functional API pipeline with inline lambdas for simple operations
-    def _safe_configure(logerr_config: dict[str, Any]) -> Result[None, Exception]:
-        """Safely configure with consistent error type."""
-        return configure_advanced(logerr_config).map_err(lambda e: Exception(str(e)))
-
-    return (
-        Result.from_predicate(
-            config_path,
-            lambda path: Path(path).exists(),
-            Exception(f"Config file not found: {config_path}"),
-        )
-        .then(lambda path: Result.of(lambda: Config().from_disk(path)))
-        .then(
-            lambda config: (
-                Option.from_nullable(config.get("logerr"))
-                .map(_safe_configure)
-                .unwrap_or(Ok(None))
-            )
-        )
-    )
+    from ..result import Err, Ok
+
+    # File loading is dominated by disk I/O, so keep this a plain
+    # straight-line sequence rather than a chain of closures. A single stat()
+    # serves as both the existence check and the cache stamp.
+    try:
+        stat = Path(config_path).stat()
+    except FileNotFoundError:
+        return Err.from_value(Exception(f"Config file not found: {config_path}"))
+    except OSError as e:
+        return Err.from_value(e)
+
+    try:
+        section = _load_logerr_section(config_path, (stat.st_mtime_ns, stat.st_size))
+    except Exception as e:
+        return Err.from_value(e)
+
+    if section is None:
+        return Ok(None)
+    return configure_advanced(section).map_err(lambda e: Exception(str(e)))
+
+
+def _load_logerr_section(
+    config_path: str, stamp: tuple[int, int]
+) -> dict[str, Any] | None:
+    """Read the "logerr" section of a confection file, reusing earlier parses.
+
+    The file is only re-parsed when its ``(mtime_ns, size)`` stamp has changed
+    since the last read, so polling an unchanged config file costs a single
+    stat().
+    """
+    cached = _confection_cache.get(config_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    # confection is only needed here, so defer its import cost to first use
+    from confection import Config
+
+    section = Config().from_disk(config_path).get("logerr")
+    _confection_cache[config_path] = (stamp, section)
+    return section
 
 
 def get_library_config(library_name: str) -> dict[str, Any]:
@@ -170,8 +250,7 @@ def get_library_config(library_name: str) -> dict[str, Any]:
         Configuration dictionary for the library
     """
     # Note: Don't use Option here as it would cause recursion during logging
-    config = get_advanced_config()
-    return config.libraries.get(library_name, {})
+    return dict(_advanced_config.libraries.get(library_name, {}))
 
 
 def should_log_for_library(library_name: str) -> bool:
@@ -184,13 +263,9 @@ def should_log_for_library(library_name: str) -> bool:
     Returns:
         True if logging should occur for this library
     """
-    config = get_advanced_config()
-    if not config.enabled:
+    if not _logging_enabled:
         return False
-
-    lib_config = get_library_config(library_name)
-    enabled = lib_config.get("enabled", True)
-    return bool(enabled)
+    return _resolved_libs.get(library_name, _resolved_default)[0]
 
 
 def get_log_level_for_library(library_name: str) -> str:
@@ -203,10 +278,7 @@ def get_log_level_for_library(library_name: str) -> str:
     Returns:
         Log level string (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    config = get_advanced_config()
-    lib_config = get_library_config(library_name)
-    level = lib_config.get("level", config.level)
-    return str(level)
+    return _resolved_libs.get(library_name, _resolved_default)[1]
 
 
 def sync_core_config() -> None:
@@ -8,6 +8,8 @@ with comprehensive error handling and Option integration.
 from __future__ import annotations
 
 import re
+from collections import Counter, defaultdict
+from collections.abc import Callable
 from datetime import datetime as dt
 from typing import Any
 
@@ -16,6 +18,140 @@ from ...result import Err, Ok, Result
 from .quality import DataQualityTracker
 from .types import FieldSpec
 
+# Common datetime formats tried (in order) for string values
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S.%f",
+)
+
+# Zero-padded strings in one of the formats above, which datetime.fromisoformat
+# parses to the same (naive) datetime once any trailing "Z" is dropped
+_ISO_DATETIME_RE = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:T\d{2}:\d{2}:\d{2}Z?| \d{2}:\d{2}:\d{2}(?:\.\d{1,6})?)?",
+    re.ASCII,
+)
+
+# Sentinel for fields absent from a document (distinct from an explicit None)
+_MISSING = object()
+
+# Value types accepted as numbers by the float and datetime converters
+_NUMERIC_TYPES = (int, float)
+
+# Normalized strings accepted as booleans
+_TRUE_STRINGS = frozenset({"true", "yes", "1", "on"})
+_FALSE_STRINGS = frozenset({"false", "no", "0", "off", ""})
+
+
+def _to_str(value: Any, target_type: type) -> str:
+    return str(value)
+
+
+def _to_int(value: Any, target_type: type) -> int:
+    if isinstance(value, int):
+        return value
+    elif isinstance(value, float) and value.is_integer():
+        return int(value)
+    elif isinstance(value, str):
+        # Try to parse string as integer
+        cleaned = value.strip()
+        if cleaned:
+            return int(cleaned)
+        else:
+            raise ValueError("Empty string")
+    else:
+        return int(value)  # Let int() handle conversion
+
+
+def _to_float(value: Any, target_type: type) -> float:
+    if isinstance(value, _NUMERIC_TYPES):
+        return float(value)
+    elif isinstance(value, str):
+        cleaned = value.strip()
+        if cleaned:
+            return float(cleaned)
+        else:
+            raise ValueError("Empty string")
+    else:
+        return float(value)
+
+
+def _to_bool(value: Any, target_type: type) -> bool:
+    if isinstance(value, bool):
+        return value
+    elif isinstance(value, int):
+        return bool(value)
+    elif isinstance(value, str):
+        lower_val = value.lower().strip()
+        if lower_val in _TRUE_STRINGS:
+            return True
+        elif lower_val in _FALSE_STRINGS:
+            return False
+        else:
+            raise ValueError(f"Cannot convert '{value}' to boolean")
+    else:
+        return bool(value)
+
+
+def _to_datetime(value: Any, target_type: type) -> dt:
+    if isinstance(value, dt):
+        return value
+    elif isinstance(value, str):
+        # Parse the usual zero-padded forms in one C call
+        if _ISO_DATETIME_RE.fullmatch(value):
+            try:
+                return dt.fromisoformat(value.removesuffix("Z"))
+            except ValueError:
+                pass
+        # Try common datetime formats
+        for fmt in _DATETIME_FORMATS:
+            try:
+                return dt.strptime(value, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"Cannot parse datetime: {value}")
+    else:
+        # For other types, try conversion if it's a timestamp
+        if isinstance(value, _NUMERIC_TYPES):
+            return dt.fromtimestamp(value)
+        else:
+            raise ValueError(f"Cannot convert {type(value).__name__} to datetime")
+
+
+def _to_container(value: Any, target_type: type) -> Any:
+    # For complex types, return as-is if they match, otherwise convert
+    if isinstance(value, target_type):
+        return value
+    else:
+        return target_type(value)
+
+
+def _to_generic(value: Any, target_type: type) -> Any:
+    # For other types, try direct conversion
+    return target_type(value)
+
+
+# Converter for each target type; anything else goes through _to_generic
+_CONVERTERS: dict[type, Callable[[Any, type], Any]] = {
+    str: _to_str,
+    int: _to_int,
+    float: _to_float,
+    bool: _to_bool,
+    dt: _to_datetime,
+    dict: _to_container,
+    list: _to_container,
+}
+
+# Characters that aren't safe in DataFrame column names. ASCII names (the
+# common case) are remapped with str.translate rather than the regex; the
+# table maps every ASCII character so translate stays on its fast path.
+_NON_WORD_RE = re.compile(r"[^\w]")
+_FIELD_NAME_TABLE = str.maketrans(
+    {c: "_" if _NON_WORD_RE.match(c) else c for c in map(chr, range(128))}
+)
+
 
 def convert_bson_value(
     value: Any,
@@ -37,91 +173,9 @@ def convert_bson_value(
     if value is None:
         return Nothing.from_none(f"Field '{field_name}' is None")
 
+    converter = _CONVERTERS.get(target_type, _to_generic)
     try:
-        # Handle different target types
-        if target_type is str:
-            return Some(str(value))
-
-        elif target_type is int:
-            if isinstance(value, int):
-                return Some(value)
-            elif isinstance(value, float) and value.is_integer():
-                return Some(int(value))
-            elif isinstance(value, str):
-                # Try to parse string as integer
-                cleaned = value.strip()
-                if cleaned:
-                    return Some(int(cleaned))
-                else:
-                    raise ValueError("Empty string")
-            else:
-                return Some(int(value))  # Let int() handle conversion
-
-        elif target_type is float:
-            if isinstance(value, int | float):
-                return Some(float(value))
-            elif isinstance(value, str):
-                cleaned = value.strip()
-                if cleaned:
-                    return Some(float(cleaned))
-                else:
-                    raise ValueError("Empty string")
-            else:
-                return Some(float(value))
-
-        elif target_type is bool:
-            if isinstance(value, bool):
-                return Some(value)
-            elif isinstance(value, int):
-                return Some(bool(value))
-            elif isinstance(value, str):
-                lower_val = value.lower().strip()
-                if lower_val in ("true", "yes", "1", "on"):
-                    return Some(True)
-                elif lower_val in ("false", "no", "0", "off", ""):
-                    return Some(False)
-                else:
-                    raise ValueError(f"Cannot convert '{value}' to boolean")
-            else:
-                return Some(bool(value))
-
-        elif target_type is dt:
-            if isinstance(value, dt):
-                return Some(value)
-            elif isinstance(value, str):
-                # Try common datetime formats
-                for fmt in [
-                    "%Y-%m-%d %H:%M:%S",
-                    "%Y-%m-%d",
-                    "%Y-%m-%dT%H:%M:%S",
-                    "%Y-%m-%dT%H:%M:%SZ",
-                    "%Y-%m-%d %H:%M:%S.%f",
-                ]:
-                    try:
-                        return Some(dt.strptime(value, fmt))
-                    except ValueError:
-                        continue
-                raise ValueError(f"Cannot parse datetime: {value}")
-            else:
-                # For other types, try conversion if it's a timestamp
-                if isinstance(value, int | float):
-                    return Some(dt.fromtimestamp(value))
-                else:
-                    raise ValueError(
-                        f"Cannot convert {type(value).__name__} to datetime"
-                    )
-
-        elif target_type in (dict, list):
-            # For complex types, return as-is if they match, otherwise convert
-            if isinstance(value, target_type):
-                return Some(value)
-            else:
-                return Some(target_type(value))
-
-        else:
-            # For other types, try direct conversion
-            return Some(target_type(value))
-
+        return Some(converter(value, target_type))
     except (ValueError, TypeError, OverflowError) as e:
         # Record conversion error if tracker is provided
         if quality_tracker:
@@ -148,24 +202,19 @@ def infer_schema_from_documents(
     # Sample documents if requested
     sample = documents[:sample_size] if sample_size else documents
 
-    # Track field types across all documents
-    field_types: dict[str, dict[type, int]] = {}
+    # Collect the value types seen for each field across all documents
+    field_types: dict[str, list[type]] = defaultdict(list)
 
     for doc in sample:
         for field_name, value in doc.items():
-            if field_name not in field_types:
-                field_types[field_name] = {}
-
-            value_type = type(value)
-            field_types[field_name][value_type] = (
-                field_types[field_name].get(value_type, 0) + 1
-            )
+            field_types[field_name].append(type(value))
 
     # Determine most common type for each field
     inferred_schema: dict[str, type] = {}
-    for field_name, type_counts in field_types.items():
-        # Get the most common type
-        most_common_type = max(type_counts.items(), key=lambda x: x[1])[0]
+    for field_name, value_types in field_types.items():
+        # Get the most common type (ties go to the type seen first)
+        type_counts = Counter(value_types)
+        most_common_type = type_counts.most_common(1)[0][0]
 
         # Handle type normalization
         if most_common_type in (int, float):
@@ -201,10 +250,11 @@ def convert_document_to_row(
     for field_spec in schema_fields:
         field_name = field_spec.name
 
-        if field_name in document:
+        value = document.get(field_name, _MISSING)
+        if value is not _MISSING:
             # Convert the value
             converted = convert_bson_value(
-                document[field_name], field_spec.field_type, field_name, quality_tracker
+                value, field_spec.field_type, field_name, quality_tracker
             )
 
             if converted.is_some():
@@ -233,6 +283,93 @@ def convert_document_to_row(
     return Ok(row)
 
 
+def convert_documents_to_columns(
+    documents: list[dict[str, Any]],
+    schema_fields: list[FieldSpec],
+    quality_tracker: DataQualityTracker | None = None,
+) -> tuple[dict[str, list[Any]], list[str]]:
+    """Convert MongoDB documents to DataFrame columns with type conversion.
+
+    Converts the same values as calling convert_document_to_row on every
+    document, but works one field at a time: each field's converter is looked
+    up once, values that already have the field's exact type are kept as-is,
+    conversion errors are recorded with the quality tracker in one call per
+    field, and the result is laid out as columns that can be handed straight
+    to a DataFrame. The quality tracker also gets the document count and
+    each schema field's presence from the same pass, so callers don't need to
+    call record_document for every document.
+
+    Args:
+        documents: MongoDB documents
+        schema_fields: List of field specifications
+        quality_tracker: Optional quality tracker
+
+    Returns:
+        Tuple of (columns for the successfully converted documents, error
+        messages for the documents that were dropped)
+    """
+    columns: dict[str, list[Any]] = {}
+    field_presence: dict[str, int] = {}
+    missing_required: dict[int, list[str]] = {}
+
+    for field_spec in schema_fields:
+        field_name = field_spec.name
+        target_type = field_spec.field_type
+        converter = _CONVERTERS.get(target_type, _to_generic)
+        column: list[Any] = []
+        present = 0
+        invalid_values: list[Any] = []
+        errors: list[Exception] = []
+
+        for index, document in enumerate(documents):
+            value = document.get(field_name, _MISSING)
+            if value is _MISSING:
+                if field_spec.is_required and quality_tracker:
+                    quality_tracker.record_missing_required_field(
+                        field_name, document.get("_id")
+                    )
+            elif value is not None:
+                present += 1
+                if type(value) is target_type:
+                    column.append(value)
+                    continue
+                try:
+                    column.append(converter(value, target_type))
+                    continue
+                except (ValueError, TypeError, OverflowError) as e:
+                    invalid_values.append(value)
+                    errors.append(e)
+
+            if field_spec.is_required:
+                missing_required.setdefault(index, []).append(field_name)
+            column.append(None)
+
+        columns[field_name] = column
+        field_presence[field_name] = present
+        if errors and quality_tracker:
+            quality_tracker.record_conversion_errors(field_name, invalid_values, errors)
+
+    if quality_tracker:
+        quality_tracker.record_documents(len(documents), field_presence)
+
+    if missing_required:
+        # Drop the failed documents from every column
+        columns = {
+            name: [
+                value
+                for index, value in enumerate(column)
+                if index not in missing_required
+            ]
+            for name, column in columns.items()
+        }
+
+    error_messages = [
+        f"Missing required fields: {missing_required[index]}"
+        for index in sorted(missing_required)
+    ]
+    return columns, error_messages
+
+
 def normalize_field_name(name: str) -> str:
     """Normalize MongoDB field names for DataFrame compatibility.
 
@@ -243,7 +380,10 @@ def normalize_field_name(name: str) -> str:
         Normalized field name safe for DataFrame columns
     """
     # Replace problematic characters
-    normalized = re.sub(r"[^\w]", "_", name)
+    if name.isascii():
+        normalized = name.translate(_FIELD_NAME_TABLE)
+    else:
+        normalized = _NON_WORD_RE.sub("_", name)
 
     # Ensure it doesn't start with a number
     if normalized and normalized[0].isdigit():
@@ -265,11 +405,4 @@ def prepare_dataframe_dtypes(schema_fields: list[FieldSpec]) -> dict[str, str]:
     Returns:
         Dictionary mapping field names to pandas dtypes
     """
-    from .types import get_pandas_dtype
-
-    dtypes = {}
-    for field_spec in schema_fields:
-        pandas_dtype = get_pandas_dtype(field_spec)
-        dtypes[field_spec.name] = pandas_dtype
-
-    return dtypes
+    return {field_spec.name: field_spec.pandas_dtype for field_spec in schema_fields}
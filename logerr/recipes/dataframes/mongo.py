@@ -8,19 +8,37 @@ to pandas/polars DataFrames with comprehensive error handling and data quality r
 from __future__ import annotations
 
 import importlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from typing import Any, Literal
 
-from ...itertools import partition_result
 from ...result import Err, Result
 from ...utilities import execute, log
 from .conversion import (
-    convert_document_to_row,
+    convert_documents_to_columns,
     infer_schema_from_documents,
     prepare_dataframe_dtypes,
 )
 from .quality import DataQualityTracker
 from .types import FieldSpec
 
+# Documents read and converted at a time when streaming a cursor, if the
+# caller doesn't pass a batch_size
+_DEFAULT_BATCH_SIZE = 1000
+
+# Nullable pandas dtypes whose arrays can be assembled directly from a numpy
+# values array and a missing-value mask: dtype -> (numpy dtype, array class)
+_MASKED_ARRAY_TYPES = {
+    "Int64": ("int64", "IntegerArray"),
+    "Float64": ("float64", "FloatingArray"),
+    "boolean": ("bool", "BooleanArray"),
+}
+
+# Polars dtypes for fields whose column type is left to polars' inference
+# (nested dicts/lists become Struct/List columns rather than Object)
+_POLARS_INFERRED_DTYPES = frozenset({"Object", "Binary"})
+
 
 def from_mongo(
     collection: Any,  # pymongo.Collection
@@ -30,7 +48,8 @@ def from_mongo(
     log_missing_data: bool = True,
     report_name: str | None = None,
     limit: int | None = None,
-    batch_size: int = 1000,
+    batch_size: int | None = None,
+    parallelism: int = 1,
 ) -> Result[Any, Exception]:  # Returns DataFrame
     """Query MongoDB collection and create DataFrame with data quality logging.
 
@@ -42,7 +61,18 @@ def from_mongo(
         log_missing_data: Whether to log data quality issues
         report_name: Name for data quality report (defaults to collection name)
         limit: Maximum number of documents to retrieve
-        batch_size: Batch size for cursor iteration
+        batch_size: Documents per server round trip, forwarded to
+            cursor.batch_size() only when given. PyMongo's default (101
+            documents, then up to 16 MiB per getMore) is usually the fastest,
+            since small fixed batches mean many more round trips. Also sets
+            how many documents are converted at a time (1000 by default).
+        parallelism: Number of concurrent sub-queries to split the result set
+            into. Values above 1 count the matching documents, then fetch
+            _id-sorted skip/limit slices on a thread pool (the I/O releases
+            the GIL) and convert them together; documents come back in _id
+            order rather than natural order. Since the server walks past
+            each skipped document, this pays off for I/O-bound queries
+            rather than very deep result sets.
 
     Returns:
         Ok(dataframe) if successful, Err(exception) if failed
@@ -61,39 +91,60 @@ def from_mongo(
     """
     # Set up operation name for logging
     operation_name = report_name or getattr(collection, "name", "mongo_query")
+    log_context = {"collection": operation_name, "query": str(query)[:200]}
 
-    # Execute the query safely
-    query_result = execute(
-        lambda: _execute_mongo_query(collection, query, limit, batch_size)
-    )
-
-    if query_result.is_err():
+    def query_failed(result: Result[Any, Exception]) -> Result[Any, Exception]:
         log(
-            f"MongoDB query failed for collection '{operation_name}': {query_result.unwrap_err()}",
+            f"MongoDB query failed for collection '{operation_name}': {result.unwrap_err()}",
             log_level="ERROR",
-            extra_context={"collection": operation_name, "query": str(query)[:200]},
+            extra_context=log_context,
+        )
+        return result
+
+    # Execute the query safely, reading only the first document up front
+    # (or every partition, when fetching in parallel)
+    if parallelism > 1:
+        query_result = execute(
+            lambda: _peek_documents(
+                _fetch_partitioned(collection, query, limit, batch_size, parallelism)
+            )
+        )
+    else:
+        query_result = execute(
+            lambda: _peek_documents(
+                _open_mongo_query(collection, query, limit, batch_size)
+            )
         )
-        return query_result
 
-    documents = query_result.unwrap()
+    if query_result.is_err():
+        return query_failed(query_result)
 
-    if not documents:
+    first_document, remaining = query_result.unwrap()
+
+    if first_document is None:
         log(
             f"No documents found in collection '{operation_name}' for query",
             log_level="WARNING",
-            extra_context={"collection": operation_name, "query": str(query)[:200]},
+            extra_context=log_context,
         )
         # Return empty DataFrame
         return _create_empty_dataframe(schema, backend)
 
     # Process schema or infer it
+    documents: Iterable[dict[str, Any]] = chain([first_document], remaining)
     if schema:
+        # Documents are streamed through conversion in batches
         schema_fields = [
             FieldSpec.from_schema_entry(name, type_spec)
             for name, type_spec in schema.items()
         ]
     else:
-        # Infer schema from documents
+        # Inferring the schema needs every document up front
+        read_result = execute(lambda: list(documents))
+        if read_result.is_err():
+            return query_failed(read_result)
+        documents = read_result.unwrap()
+
         inferred_schema = infer_schema_from_documents(documents)
         schema_fields = [
             FieldSpec.from_schema_entry(name, type_spec)
@@ -107,9 +158,15 @@ def from_mongo(
                 extra_context={"inferred_fields": list(inferred_schema.keys())},
             )
 
-    # Convert documents to DataFrame
+    # Convert documents to DataFrame (reading any remaining batches)
     return _documents_to_dataframe(
-        documents, schema_fields, backend, str(operation_name), log_missing_data
+        documents,
+        schema_fields,
+        backend,
+        str(operation_name),
+        log_missing_data,
+        batch_size,
+        on_read_error=query_failed,
     )
 
 
@@ -119,7 +176,7 @@ def from_mongo_cursor(
     backend: Literal["pandas"] = "pandas",
     log_missing_data: bool = True,
     report_name: str = "cursor_conversion",
-    batch_size: int = 1000,
+    batch_size: int | None = None,
 ) -> Result[Any, Exception]:  # Returns DataFrame
     """Convert MongoDB cursor to DataFrame with data quality logging.
 
@@ -129,51 +186,70 @@ def from_mongo_cursor(
         backend: DataFrame backend ("pandas" or "polars")
         log_missing_data: Whether to log data quality issues
         report_name: Name for data quality report
-        batch_size: Batch size for cursor iteration
+        batch_size: Documents converted at a time (1000 if not given). The
+            cursor's own server batch size is left as configured.
 
     Returns:
         Ok(dataframe) if successful, Err(exception) if failed
     """
-    # Execute cursor iteration safely
-    documents_result = execute(lambda: list(cursor))
 
-    if documents_result.is_err():
+    def iteration_failed(result: Result[Any, Exception]) -> Result[Any, Exception]:
         log(
-            f"Failed to iterate MongoDB cursor: {documents_result.unwrap_err()}",
+            f"Failed to iterate MongoDB cursor: {result.unwrap_err()}",
             log_level="ERROR",
             extra_context={"operation": report_name},
         )
-        return documents_result
+        return result
 
-    documents = documents_result.unwrap()
+    # Execute cursor iteration safely, reading only the first document up front
+    documents_result = execute(lambda: _peek_documents(cursor))
 
-    if not documents:
+    if documents_result.is_err():
+        return iteration_failed(documents_result)
+
+    first_document, remaining = documents_result.unwrap()
+
+    if first_document is None:
         log(f"No documents found in cursor for '{report_name}'", log_level="WARNING")
         return _create_empty_dataframe(schema, backend)
 
     # Process schema
+    documents: Iterable[dict[str, Any]] = chain([first_document], remaining)
     if schema:
+        # Documents are streamed through conversion in batches
         schema_fields = [
             FieldSpec.from_schema_entry(name, type_spec)
             for name, type_spec in schema.items()
         ]
     else:
+        # Inferring the schema needs every document up front
+        read_result = execute(lambda: list(documents))
+        if read_result.is_err():
+            return iteration_failed(read_result)
+        documents = read_result.unwrap()
+
         inferred_schema = infer_schema_from_documents(documents)
         schema_fields = [
             FieldSpec.from_schema_entry(name, type_spec)
             for name, type_spec in inferred_schema.items()
         ]
 
-    # Convert to DataFrame
+    # Convert to DataFrame (reading any remaining batches)
     return _documents_to_dataframe(
-        documents, schema_fields, backend, report_name, log_missing_data
+        documents,
+        schema_fields,
+        backend,
+        report_name,
+        log_missing_data,
+        batch_size,
+        on_read_error=iteration_failed,
     )
 
 
-def _execute_mongo_query(
-    collection: Any, query: dict[str, Any], limit: int | None, batch_size: int
-) -> list[dict[str, Any]]:
-    """Execute MongoDB query and return documents."""
+def _open_mongo_query(
+    collection: Any, query: dict[str, Any], limit: int | None, batch_size: int | None
+) -> Any:  # pymongo.Cursor
+    """Start a MongoDB query and return its (not yet iterated) cursor."""
     cursor = collection.find(query)
 
     if limit:
@@ -182,17 +258,77 @@ def _execute_mongo_query(
     if batch_size:
         cursor = cursor.batch_size(batch_size)
 
-    return list(cursor)
+    return cursor
+
+
+def _fetch_partitioned(
+    collection: Any,
+    query: dict[str, Any],
+    limit: int | None,
+    batch_size: int | None,
+    parallelism: int,
+) -> list[dict[str, Any]]:
+    """Fetch a query's documents as concurrent _id-sorted skip/limit slices."""
+    total = collection.count_documents(query)
+    if limit:
+        total = min(total, limit)
+    if not total:
+        return []
+    chunk_size = -(-total // parallelism)  # ceil
+
+    def fetch(offset: int) -> list[dict[str, Any]]:
+        # A non-zero limit, since limit(0) means "no limit" to MongoDB
+        cursor = (
+            collection.find(query)
+            .sort("_id", 1)
+            .skip(offset)
+            .limit(min(chunk_size, total - offset))
+        )
+        if batch_size:
+            cursor = cursor.batch_size(batch_size)
+        return list(cursor)
+
+    with ThreadPoolExecutor(max_workers=parallelism) as pool:
+        partitions = list(pool.map(fetch, range(0, total, chunk_size)))
+
+    return [document for partition in partitions for document in partition]
+
+
+def _peek_documents(
+    cursor: Iterable[dict[str, Any]],
+) -> tuple[dict[str, Any] | None, Iterator[dict[str, Any]]]:
+    """Read the first document from a cursor, returning it and the rest."""
+    documents = iter(cursor)
+    return next(documents, None), documents
+
+
+def _iter_document_batches(
+    documents: Iterable[dict[str, Any]], batch_size: int | None
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield documents in lists of up to batch_size (the default if not positive)."""
+    size = batch_size if batch_size and batch_size > 0 else _DEFAULT_BATCH_SIZE
+    iterator = iter(documents)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 def _documents_to_dataframe(
-    documents: list[dict[str, Any]],
+    documents: Iterable[dict[str, Any]],
     schema_fields: list[FieldSpec],
     backend: str,
     operation_name: str,
     log_missing_data: bool,
+    batch_size: int | None = None,
+    on_read_error: Callable[[Result[Any, Exception]], Result[Any, Exception]]
+    | None = None,
 ) -> Result[Any, Exception]:
-    """Convert documents to DataFrame with quality tracking."""
+    """Convert documents to DataFrame with quality tracking.
+
+    Documents are read and converted batch_size at a time, so a streaming
+    cursor never has more than one batch of raw documents in memory. An
+    error raised while reading documents is returned as an Err, passed
+    through on_read_error if given; errors in conversion itself propagate.
+    """
     quality_tracker = DataQualityTracker(operation_name) if log_missing_data else None
 
     # Set required fields for quality tracking
@@ -200,31 +336,45 @@ def _documents_to_dataframe(
         required_fields = {spec.name for spec in schema_fields if spec.is_required}
         quality_tracker.set_required_fields(required_fields)
 
-    # Convert each document to a row. Failed rows are skipped rather than
-    # failing the entire operation, so we partition (not sequence/traverse,
-    # which would short-circuit on the first Err) into successes and errors.
-    row_results = []
-    for doc in documents:
-        if quality_tracker:
-            quality_tracker.record_document(doc)
-        row_results.append(convert_document_to_row(doc, schema_fields, quality_tracker))
+    # Convert the documents field by field into columns, recording field
+    # presence as we go. Failed documents are dropped rather than failing the
+    # entire operation.
+    columns: dict[str, list[Any]] = {spec.name: [] for spec in schema_fields}
+    error_messages: list[str] = []
+    document_count = 0
+
+    batches = _iter_document_batches(documents, batch_size)
+    while True:
+        read_result = execute(lambda: next(batches, None))
+        if read_result.is_err():
+            return on_read_error(read_result) if on_read_error else read_result
+        batch = read_result.unwrap()
+        if batch is None:
+            break
+
+        document_count += len(batch)
+        batch_columns, batch_errors = convert_documents_to_columns(
+            batch, schema_fields, quality_tracker
+        )
+        for field_name, values in batch_columns.items():
+            columns[field_name].extend(values)
+        error_messages.extend(batch_errors)
 
-    successful_rows, error_messages = partition_result(row_results)
+    successful_count = document_count - len(error_messages)
 
     if quality_tracker:
-        for _ in successful_rows:
-            quality_tracker.record_successful_conversion()
+        quality_tracker.record_successful_conversion(successful_count)
         for error_msg in error_messages:
             quality_tracker.record_failed_conversion(error_msg)
 
-    if not successful_rows:
-        error_msg = f"No valid rows could be created from {len(documents)} documents"
+    if not successful_count:
+        error_msg = f"No valid rows could be created from {document_count} documents"
         log(error_msg, log_level="ERROR", extra_context={"operation": operation_name})
         return Err.from_value(Exception(error_msg))
 
     # Create DataFrame
     dataframe_result = execute(
-        lambda: _create_dataframe_from_rows(successful_rows, schema_fields, backend)
+        lambda: _create_dataframe_from_rows(columns, schema_fields, backend)
     )
 
     # Generate quality report if tracking enabled
@@ -248,9 +398,11 @@ def _documents_to_dataframe(
 
 
 def _create_dataframe_from_rows(
-    rows: list[dict[str, Any]], schema_fields: list[FieldSpec], backend: str
+    rows: list[dict[str, Any]] | dict[str, list[Any]],
+    schema_fields: list[FieldSpec],
+    backend: str,
 ) -> Any:  # DataFrame
-    """Create DataFrame from processed rows."""
+    """Create DataFrame from processed rows (a list of dicts or a dict of columns)."""
     if backend == "pandas":
         return _create_pandas_dataframe(rows, schema_fields)
     elif backend == "polars":
@@ -260,7 +412,7 @@ def _create_dataframe_from_rows(
 
 
 def _create_pandas_dataframe(
-    rows: list[dict[str, Any]], schema_fields: list[FieldSpec]
+    rows: list[dict[str, Any]] | dict[str, list[Any]], schema_fields: list[FieldSpec]
 ) -> Any:
     """Create pandas DataFrame with appropriate nullable types."""
     try:
@@ -270,34 +422,104 @@ def _create_pandas_dataframe(
             "pandas is required for pandas backend. Install with: pip install pandas"
         ) from e
 
+    dtypes = prepare_dataframe_dtypes(schema_fields)
+
     if not rows:
         # Create empty DataFrame with correct schema
-        dtypes = prepare_dataframe_dtypes(schema_fields)
         return pd.DataFrame(columns=list(dtypes.keys())).astype(dtypes)
 
+    if isinstance(rows, dict):
+        # Columns: build each column's array with its nullable dtype directly,
+        # rather than inferring a dtype first and converting afterwards
+        return pd.DataFrame(
+            {
+                field_name: _create_pandas_column(
+                    pd, field_name, values, dtypes.get(field_name)
+                )
+                for field_name, values in rows.items()
+            }
+        )
+
     # Create DataFrame from rows
     df = pd.DataFrame(rows)
 
-    # Apply type conversions for better nullable type support
-    dtypes = prepare_dataframe_dtypes(schema_fields)
-
-    for field_name, dtype in dtypes.items():
-        if field_name in df.columns:
-            try:
-                df[field_name] = df[field_name].astype(dtype)
-            except (ValueError, TypeError) as e:
-                # Log conversion warning but continue
-                log(
-                    f"Could not convert column '{field_name}' to {dtype}: {e}",
-                    log_level="WARNING",
-                    extra_context={"column": field_name, "target_dtype": dtype},
-                )
+    # Apply type conversions for better nullable type support, all columns in
+    # one astype() call when they all convert cleanly
+    applicable = {
+        field_name: dtype
+        for field_name, dtype in dtypes.items()
+        if field_name in df.columns
+    }
+    try:
+        return df.astype(applicable)
+    except (ValueError, TypeError):
+        pass
+
+    # Some column failed: convert one at a time to find and log it
+    for field_name, dtype in applicable.items():
+        try:
+            df[field_name] = df[field_name].astype(dtype)
+        except (ValueError, TypeError) as e:
+            # Log conversion warning but continue
+            _log_dtype_failure(field_name, dtype, e)
 
     return df
 
 
+def _create_pandas_column(
+    pd: Any, field_name: str, values: list[Any], dtype: str | None
+) -> Any:
+    """Create a pandas column in the given dtype, falling back to inference.
+
+    A bare array (no per-column index) is enough for the DataFrame
+    constructor; the fallback uses Series so inference matches DataFrame(rows).
+    """
+    if dtype in _MASKED_ARRAY_TYPES:
+        try:
+            return _create_masked_array(pd, values, dtype)
+        except (ValueError, TypeError, OverflowError):
+            pass  # pd.array below reports the failure
+    if dtype is not None:
+        try:
+            return pd.array(values, dtype=dtype)
+        except (ValueError, TypeError, OverflowError) as e:
+            # Log conversion warning but continue
+            _log_dtype_failure(field_name, dtype, e)
+    return pd.Series(values)
+
+
+def _create_masked_array(pd: Any, values: list[Any], dtype: str) -> Any:
+    """Build a nullable numeric/boolean array without per-value inference.
+
+    The values must already have the column's Python type (or be None), as
+    convert_documents_to_columns guarantees. The None mask and the cast to the
+    numpy dtype are each a single vectorized call over an object array, which
+    is several times faster than pd.array() checking every value.
+    """
+    np = importlib.import_module("numpy")
+    numpy_dtype, array_class = _MASKED_ARRAY_TYPES[dtype]
+
+    objects = np.array(values, dtype=object)
+    mask = np.equal(objects, None)
+    objects[mask] = 0
+    data = objects.astype(numpy_dtype)
+    if dtype == "Float64":
+        # pd.array treats NaN as missing in Float64 columns
+        mask |= np.isnan(data)
+    return getattr(pd.arrays, array_class)(data, mask)
+
+
+def _log_dtype_failure(field_name: str, dtype: str, error: Exception) -> None:
+    """Log a column that couldn't be converted to its schema dtype."""
+    log(
+        f"Could not convert column '{field_name}' to {dtype}: {error}",
+        log_level="WARNING",
+        extra_context={"column": field_name, "target_dtype": dtype},
+    )
+
+
 def _create_polars_dataframe(
-    rows: list[dict[str, Any]], schema_fields: list[FieldSpec]
+    rows: list[dict[str, Any]] | dict[str, list[Any]], schema_fields: list[FieldSpec]
 ) -> Any:
     """Create polars DataFrame with appropriate nullable types."""
     try:
@@ -309,14 +531,28 @@ def _create_polars_dataframe(
 
     if not rows:
         # Create empty DataFrame with correct schema
-        from .types import get_polars_dtype
-
-        schema = {
-            spec.name: getattr(pl, get_polars_dtype(spec)) for spec in schema_fields
-        }
+        schema = {spec.name: getattr(pl, spec.polars_dtype) for spec in schema_fields}
         return pl.DataFrame([], schema=schema)
 
-    # Create DataFrame from rows - polars handles nullable types automatically
+    # Build scalar columns straight into the schema's dtypes, rather than having
+    # polars infer each column's type from the values first. Nested and binary
+    # fields are left to inference, which gives Struct/List/Binary columns
+    # instead of opaque Object ones.
+    overrides = {
+        spec.name: getattr(pl, spec.polars_dtype)
+        for spec in schema_fields
+        if spec.polars_dtype not in _POLARS_INFERRED_DTYPES
+    }
+    try:
+        return pl.DataFrame(rows, schema_overrides=overrides)
+    except (TypeError, ValueError, OverflowError, pl.exceptions.PolarsError) as e:
+        log(
+            f"Could not build polars DataFrame with schema dtypes: {e}",
+            log_level="WARNING",
+            extra_context={"schema": {name: str(t) for name, t in overrides.items()}},
+        )
+
+    # Fall back to inferred types - polars handles nullable types automatically
     return pl.DataFrame(rows)
 
 
@@ -12,6 +12,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any
 
+from ...config import should_log
 from ...utilities import log
 from .types import FieldSpec
 
@@ -149,13 +150,28 @@ class DataQualityTracker:
             if document[field_name] is not None:
                 self.field_presence[field_name] += 1
 
-    def record_successful_conversion(self) -> None:
-        """Record a successful document conversion."""
-        self.successful_records += 1
+    def record_documents(self, count: int, field_presence: dict[str, int]) -> None:
+        """Record metrics for a batch of documents at once.
+
+        Args:
+            count: Number of documents in the batch
+            field_presence: Number of documents with a non-None value, per field
+        """
+        self.total_records += count
+
+        for field_name, present in field_presence.items():
+            if present:
+                self.field_presence[field_name] += present
+
+    def record_successful_conversion(self, count: int = 1) -> None:
+        """Record successful document conversions (one by default)."""
+        self.successful_records += count
 
     def record_failed_conversion(self, reason: str = "unknown") -> None:
         """Record a failed document conversion."""
         self.failed_records += 1
+        if not should_log():
+            return
         log(
             f"Failed to convert document: {reason}",
             log_level="DEBUG",
@@ -170,6 +186,9 @@ class DataQualityTracker:
         if len(self.field_invalid_values[field_name]) < 10:  # Keep first 10 examples
             self.field_invalid_values[field_name].append(invalid_value)
 
+        # Only format the message and truncated value if they'll be logged
+        if not should_log():
+            return
         log(
             f"Type conversion error for field '{field_name}': {error}",
             log_level="DEBUG",
@@ -180,10 +199,40 @@ class DataQualityTracker:
             },
         )
 
+    def record_conversion_errors(
+        self, field_name: str, invalid_values: list[Any], errors: list[Exception]
+    ) -> None:
+        """Record a batch of type conversion errors for a specific field.
+
+        Equivalent to calling record_conversion_error for each value/error
+        pair, but logs a single summary message for the whole batch.
+        """
+        if not errors:
+            return
+
+        self.field_conversion_errors[field_name] += len(errors)
+        examples = self.field_invalid_values[field_name]
+        examples.extend(invalid_values[: 10 - len(examples)])  # Keep first 10
+
+        if not should_log():
+            return
+        log(
+            f"{len(errors)} type conversion errors for field '{field_name}', "
+            f"first: {errors[0]}",
+            log_level="DEBUG",
+            extra_context={
+                "field": field_name,
+                "invalid_values": [str(v)[:100] for v in invalid_values[:5]],
+                "error_types": sorted({type(e).__name__ for e in errors}),
+            },
+        )
+
     def record_missing_required_field(
         self, field_name: str, document_id: Any = None
     ) -> None:
         """Record a missing required field violation."""
+        if not should_log():
+            return
         log(
             f"Missing required field '{field_name}' in document",
             log_level="ERROR",
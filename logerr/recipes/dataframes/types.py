@@ -7,7 +7,7 @@ as Optional[T] by default.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime as dt
 from typing import Any, get_args
 
@@ -34,14 +34,28 @@ class Required[T]:
         return cls(item)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FieldSpec:
-    """Specification for a schema field with metadata."""
+    """Specification for a schema field with metadata.
+
+    The pandas and polars dtypes for the field are looked up once, when the
+    spec is created.
+    """
 
     name: str
     field_type: type
     is_required: bool
     default_value: Any = None
+    pandas_dtype: str = field(init=False, repr=False, compare=False)
+    polars_dtype: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "pandas_dtype", BSON_TYPE_MAPPING.get(self.field_type, "object")
+        )
+        object.__setattr__(
+            self, "polars_dtype", POLARS_TYPE_MAPPING.get(self.field_type, "Object")
+        )
 
     @classmethod
     def from_schema_entry(cls, field_name: str, type_spec: Any) -> FieldSpec:
@@ -58,10 +72,7 @@ class FieldSpec:
             return cls(
                 name=field_name, field_type=type_spec.inner_type, is_required=True
             )
-        elif (
-            hasattr(type_spec, "__origin__")
-            and getattr(type_spec, "__origin__", None) is Required
-        ):
+        elif getattr(type_spec, "__origin__", None) is Required:
             # Handle Required[T] when used as type annotation
             inner_type = get_args(type_spec)[0]
             return cls(name=field_name, field_type=inner_type, is_required=True)
@@ -82,51 +93,36 @@ BSON_TYPE_MAPPING: dict[type, str] = {
     bytes: "object",
 }
 
+# Polars type mappings (all types are nullable by default in Polars)
+POLARS_TYPE_MAPPING: dict[type, str] = {
+    str: "Utf8",
+    int: "Int64",
+    float: "Float64",
+    bool: "Boolean",
+    dt: "Datetime",
+    dict: "Object",
+    list: "Object",
+    bytes: "Binary",
+}
+
 
 # Type validation functions
 def is_valid_type_spec(type_spec: Any) -> bool:
     """Check if a type specification is valid for schema definition."""
-    if isinstance(type_spec, Required):
+    if isinstance(type_spec, (Required, type)):
         return True
-    if (
-        hasattr(type_spec, "__origin__")
-        and getattr(type_spec, "__origin__", None) is Required
-    ):
-        return True
-    if isinstance(type_spec, type):
-        return True
-    # Handle generic types like List[str], Dict[str, int], etc.
+    # Handle Required[T] annotations and generic types like List[str],
+    # Dict[str, int], etc.
     return hasattr(type_spec, "__origin__")
 
 
 def get_pandas_dtype(field_spec: FieldSpec) -> str:
     """Get appropriate pandas dtype for a field specification."""
-    base_type = field_spec.field_type
-
-    # Handle Required fields - they can use non-nullable types if desired
-    if field_spec.is_required:
-        # For required fields, we could use non-nullable types, but let's keep
-        # everything nullable for consistency with NoSQL flexibility
-        pass
-
-    # Map to pandas nullable types
-    return BSON_TYPE_MAPPING.get(base_type, "object")
+    # Required fields could use non-nullable types, but everything is kept
+    # nullable for consistency with NoSQL flexibility
+    return field_spec.pandas_dtype
 
 
 def get_polars_dtype(field_spec: FieldSpec) -> str:
     """Get appropriate polars dtype for a field specification."""
-    base_type = field_spec.field_type
-
-    # Polars type mapping (all types are nullable by default in Polars)
-    polars_mapping = {
-        str: "Utf8",
-        int: "Int64",
-        float: "Float64",
-        bool: "Boolean",
-        dt: "Datetime",
-        dict: "Object",
-        list: "Object",
-        bytes: "Binary",
-    }
-
-    return polars_mapping.get(base_type, "Object")
+    return field_spec.polars_dtype
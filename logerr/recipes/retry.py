@@ -7,26 +7,298 @@ Result types and automatically log retry attempts using loguru.
 
 from __future__ import annotations
 
+import asyncio
 import functools
-from collections.abc import Callable
+import inspect
+import operator
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 from loguru import logger
 from tenacity import (  # type: ignore[import-not-found]
+    AsyncRetrying,
     RetryError,
     Retrying,
+    retry_if_not_exception_type,
+    retry_if_result,
     stop_after_attempt,
     wait_exponential,
-    wait_fixed,
 )
 
-from ..option import Option
 from ..result import Err, Ok, Result
 
 T = TypeVar("T")
 E = TypeVar("E")
 U = TypeVar("U")
 
+# Decorator defaults when neither stop nor wait is given: three attempts,
+# waiting like tenacity's wait_exponential(multiplier=1, min=4, max=10)
+_DEFAULT_MAX_ATTEMPTS = 3
+_DEFAULT_WAIT = (1.0, 4.0, 10.0)  # (multiplier, min, max) in seconds
+
+# Longest wait between with_retry/until_ok attempts when backing off
+_MAX_BACKOFF = 30.0
+
+
+class _NotAwaitableError(TypeError):
+    """Raised when an async retry helper's callable doesn't return an awaitable.
+
+    Not retried: every attempt would fail the same way.
+    """
+
+
+# Under tenacity, retry attempts that raised or returned False (not finished).
+# Checking the returned value directly avoids raising an exception per Err.
+_RETRY_UNFINISHED_ATTEMPTS = retry_if_not_exception_type(
+    _NotAwaitableError
+) | retry_if_result(operator.not_)
+
+
+def _backoff_wait(
+    attempt_number: int, multiplier: float, min_wait: float, max_wait: float
+) -> float:
+    """Seconds to wait after a failed attempt, as tenacity's wait_exponential."""
+    try:
+        wait = multiplier * 2 ** (attempt_number - 1)
+    except OverflowError:
+        wait = max_wait
+    return max(min_wait, min(wait, max_wait))
+
+
+@functools.lru_cache(maxsize=128)
+def _wait_schedule(
+    max_attempts: int, multiplier: float, min_wait: float, max_wait: float
+) -> tuple[float, ...]:
+    """Seconds to wait after each failed attempt but the last.
+
+    The schedule only depends on these arguments, so it's computed once for
+    each combination (the decorator defaults and quick/standard/persistent
+    are hit on every call) and the retry loops just step through it.
+    """
+    return tuple(
+        _backoff_wait(attempt_number, multiplier, min_wait, max_wait)
+        for attempt_number in range(1, max_attempts)
+    )
+
+
+def _simple_retry_loop(
+    attempt: Callable[[int], bool], waits: tuple[float, ...]
+) -> tuple[bool, int]:
+    """Call attempt(1), attempt(2), ... until one returns True.
+
+    A plain loop with the same schedule as tenacity's Retrying with
+    stop_after_attempt and wait_exponential (wait_fixed when min_wait equals
+    max_wait), without building its per-attempt state. Makes len(waits) + 1
+    attempts at most, sleeping waits[n - 1] seconds after failed attempt n.
+    An exception raised by attempt counts as a failed attempt, as it does
+    under tenacity.
+
+    Returns:
+        Tuple of (whether an attempt returned True, number of attempts made)
+    """
+    for attempt_number, wait in enumerate((*waits, None), 1):
+        try:
+            if attempt(attempt_number):
+                return True, attempt_number
+        except Exception:
+            pass
+        if wait is not None:
+            time.sleep(wait)
+    return False, len(waits) + 1
+
+
+async def _async_simple_retry_loop(
+    attempt: Callable[[int], Awaitable[bool]], waits: tuple[float, ...]
+) -> tuple[bool, int]:
+    """Async _simple_retry_loop: awaits each attempt and asyncio.sleep between."""
+    for attempt_number, wait in enumerate((*waits, None), 1):
+        try:
+            if await attempt(attempt_number):
+                return True, attempt_number
+        except _NotAwaitableError:
+            raise
+        except Exception:
+            pass
+        if wait is not None:
+            await asyncio.sleep(wait)
+    return False, len(waits) + 1
+
+
+def _tenacity_retry_loop(
+    attempt: Callable[[int], bool], stop: Any, wait: Any
+) -> tuple[bool, int]:
+    """Call attempt(1), attempt(2), ... under custom tenacity stop/wait strategies.
+
+    Returns:
+        Tuple of (whether an attempt returned True, number of attempts made)
+    """
+    attempt_number = 0
+
+    def next_attempt() -> bool:
+        nonlocal attempt_number
+        attempt_number += 1
+        return attempt(attempt_number)
+
+    retrying = Retrying(
+        stop=stop, wait=wait, retry=_RETRY_UNFINISHED_ATTEMPTS, reraise=False
+    )
+    try:
+        retrying(next_attempt)
+    except RetryError:
+        return False, attempt_number
+    return True, attempt_number
+
+
+async def _async_tenacity_retry_loop(
+    attempt: Callable[[int], Awaitable[bool]], stop: Any, wait: Any
+) -> tuple[bool, int]:
+    """Async _tenacity_retry_loop, driven by tenacity's AsyncRetrying."""
+    attempt_number = 0
+
+    async def next_attempt() -> bool:
+        nonlocal attempt_number
+        attempt_number += 1
+        return await attempt(attempt_number)
+
+    retrying = AsyncRetrying(
+        stop=stop, wait=wait, retry=_RETRY_UNFINISHED_ATTEMPTS, reraise=False
+    )
+    try:
+        await retrying(next_attempt)
+    except RetryError:
+        return False, attempt_number
+    return True, attempt_number
+
+
+def _attempt_runner(
+    stop: Any,
+    wait: Any,
+    simple_loop: Callable[..., Any] = _simple_retry_loop,
+    tenacity_loop: Callable[..., Any] = _tenacity_retry_loop,
+) -> Callable[..., Any]:
+    """Choose how a retry decorator runs its attempts.
+
+    The default schedule runs as a plain loop; tenacity is only driven when the
+    caller passes their own stop or wait strategy. Strategies are resolved
+    once, since tenacity's keep no state between calls. The async decorators
+    pass the async loops.
+    """
+    if stop is None and wait is None:
+        return functools.partial(
+            simple_loop, waits=_wait_schedule(_DEFAULT_MAX_ATTEMPTS, *_DEFAULT_WAIT)
+        )
+
+    multiplier, min_wait, max_wait = _DEFAULT_WAIT
+    return functools.partial(
+        tenacity_loop,
+        stop=stop if stop is not None else stop_after_attempt(_DEFAULT_MAX_ATTEMPTS),
+        wait=(
+            wait
+            if wait is not None
+            else wait_exponential(multiplier=multiplier, min=min_wait, max=max_wait)
+        ),
+    )
+
+
+def _reject_coroutine_function(func: Callable[..., Any], async_name: str) -> None:
+    """Raise TypeError if a sync retry helper is given a coroutine function.
+
+    Its result would be an un-awaited coroutine, treated as a success.
+    """
+    if inspect.iscoroutinefunction(func):
+        raise TypeError(
+            f"{getattr(func, '__name__', 'callable')} is a coroutine function; "
+            f"use {async_name} to retry it"
+        )
+
+
+def _check_awaitable(
+    value: Any, attempt_number: int, func: Callable[..., Any], sync_name: str
+) -> Any:
+    """Return what an async helper's callable returned, if it can be awaited.
+
+    Raises _NotAwaitableError (a TypeError) when the first call returns
+    something else, rather than retrying a sync function until it runs out
+    of attempts.
+    """
+    if attempt_number == 1 and not inspect.isawaitable(value):
+        raise _NotAwaitableError(
+            f"{getattr(func, '__name__', 'callable')} returned "
+            f"{type(value).__name__}, not an awaitable; use {sync_name} to retry it"
+        )
+    return value
+
+
+def _on_err_attempt_done(
+    result: Result[Any, Any], attempt_number: int, func_name: str, log_attempts: bool
+) -> bool:
+    """Whether an on_err attempt ends the retries (it returned Ok)."""
+    if result.is_ok():
+        return True
+
+    if log_attempts:
+        logger.debug(
+            "Attempt {} of {} failed: {}",
+            attempt_number,
+            func_name,
+            result.unwrap_err(),
+        )
+    return False
+
+
+def _on_err_type_attempt_done(
+    result: Result[Any, Any],
+    error_types: tuple[type[Exception], ...],
+    attempt_number: int,
+    func_name: str,
+    log_attempts: bool,
+) -> bool:
+    """Whether an on_err_type attempt ends the retries (Ok or non-retryable Err)."""
+    if result.is_ok():
+        return True
+
+    error = result.unwrap_err()
+
+    # Only retry if error is one of the specified types
+    if isinstance(error, error_types):
+        if log_attempts:
+            logger.debug(
+                "Attempt {} of {} failed with {}: {}",
+                attempt_number,
+                func_name,
+                type(error).__name__,
+                error,
+            )
+        return False
+
+    # Don't retry this error type
+    if log_attempts:
+        logger.debug(
+            "{} failed with non-retryable error {}: {}",
+            func_name,
+            type(error).__name__,
+            error,
+        )
+    return True
+
+
+def _retry_outcome[T, E](
+    result: Result[T, E] | None,
+    succeeded: bool,
+    attempt_count: int,
+    func_name: str,
+    log_attempts: bool,
+) -> Result[T, E]:
+    """Log how a retried call ended and return its final Result."""
+    if log_attempts:
+        if not succeeded:
+            logger.warning("{} failed after {} attempts", func_name, attempt_count)
+        elif attempt_count > 1 and result is not None and result.is_ok():
+            logger.info("{} succeeded after {} attempts", func_name, attempt_count)
+
+    return result if result is not None else Err.from_value("All retry attempts failed")  # type: ignore
+
 
 def on_err(
     stop: Any = None,
@@ -35,6 +307,9 @@ def on_err(
 ) -> Callable[[Callable[..., Result[T, E]]], Callable[..., Result[T, E]]]:
     """Retry a Result-returning function when it returns Err.
 
+    Without stop or wait, the function is tried three times, waiting 4 to 10
+    seconds between attempts.
+
     Args:
         stop: Tenacity stop condition (when to stop retrying).
         wait: Tenacity wait condition (how long to wait between retries).
@@ -45,75 +320,35 @@ def on_err(
         ... def flaky_operation() -> Result[int, str]:
         ...     return Ok(42)  # or Err("failed") sometimes
 
+        >>> from tenacity import wait_fixed
         >>> @on_err(wait=wait_fixed(1), log_attempts=True)
         ... def network_call() -> Result[str, Exception]:
         ...     return Ok("success")
     """
 
     def decorator(func: Callable[..., Result[T, E]]) -> Callable[..., Result[T, E]]:
+        _reject_coroutine_function(func, "aon_err")
+        run_attempts = _attempt_runner(stop, wait)
+        func_name = getattr(func, "__name__", "callable")
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Result[T, E]:
             last_result: Result[T, E] | None = None
-            attempt_count = 0
 
-            # Use functional API for parameter defaults
+            if log_attempts:
+                logger.debug("Starting retry operation for {}", func_name)
 
-            actual_stop = Option.from_nullable(stop).unwrap_or_else(
-                lambda: stop_after_attempt(3)
-            )
-            actual_wait = Option.from_nullable(wait).unwrap_or_else(
-                lambda: wait_exponential(multiplier=1, min=4, max=10)
-            )
+            def attempt(attempt_number: int) -> bool:
+                nonlocal last_result
+                last_result = func(*args, **kwargs)
+                return _on_err_attempt_done(
+                    last_result, attempt_number, func_name, log_attempts
+                )
 
-            if log_attempts:
-                func_name = Option.of(lambda: func.__name__).unwrap_or("callable")
-                logger.debug(f"Starting retry operation for {func_name}")
-
-            try:
-                for attempt in Retrying(
-                    stop=actual_stop, wait=actual_wait, reraise=False
-                ):
-                    with attempt:
-                        attempt_count += 1
-                        result = func(*args, **kwargs)
-                        last_result = result
-
-                        if result.is_err():
-                            error = result.unwrap_err()
-                            if log_attempts:
-                                logger.debug(
-                                    f"Attempt {attempt_count} of {func_name} failed: {error}"
-                                )
-
-                            # Convert to exception for tenacity
-                            if isinstance(error, Exception):
-                                raise error
-                            else:
-                                raise ValueError(f"Operation failed: {error}")
-
-                        # Success case
-                        if log_attempts and attempt_count > 1:
-                            logger.info(
-                                f"{func_name} succeeded after {attempt_count} attempts"
-                            )
-
-                        return result
-
-            except RetryError:
-                if log_attempts:
-                    logger.warning(f"{func_name} failed after {attempt_count} attempts")
-
-                return (
-                    last_result
-                    if last_result is not None
-                    else Err.from_value("All retry attempts failed")
-                )  # type: ignore
-
-            return (
-                last_result
-                if last_result is not None
-                else Err.from_value("Unknown retry error")
-            )  # type: ignore
+            succeeded, attempt_count = run_attempts(attempt)
+            return _retry_outcome(
+                last_result, succeeded, attempt_count, func_name, log_attempts
+            )
 
         return wrapper
 
@@ -128,6 +363,9 @@ def on_err_type(
 ) -> Callable[[Callable[..., Result[T, E]]], Callable[..., Result[T, E]]]:
     """Retry only when Result contains specific exception types.
 
+    Without stop or wait, the function is tried three times, waiting 4 to 10
+    seconds between attempts.
+
     Args:
         error_types: Exception types that should trigger retries.
         stop: Tenacity stop condition.
@@ -141,76 +379,32 @@ def on_err_type(
     """
 
     def decorator(func: Callable[..., Result[T, E]]) -> Callable[..., Result[T, E]]:
+        _reject_coroutine_function(func, "aon_err_type")
+        run_attempts = _attempt_runner(stop, wait)
+        func_name = getattr(func, "__name__", "callable")
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Result[T, E]:
             last_result: Result[T, E] | None = None
-            attempt_count = 0
-
-            # Use functional API for parameter defaults
-
-            actual_stop = Option.from_nullable(stop).unwrap_or_else(
-                lambda: stop_after_attempt(3)
-            )
-            actual_wait = Option.from_nullable(wait).unwrap_or_else(
-                lambda: wait_exponential(multiplier=1, min=4, max=10)
-            )
 
             if log_attempts:
-                func_name = Option.of(lambda: func.__name__).unwrap_or("callable")
                 logger.debug(
-                    f"Starting retry operation for {func_name} (retrying on: {error_types})"
+                    "Starting retry operation for {} (retrying on: {})",
+                    func_name,
+                    error_types,
                 )
 
-            try:
-                for attempt in Retrying(
-                    stop=actual_stop, wait=actual_wait, reraise=False
-                ):
-                    with attempt:
-                        attempt_count += 1
-                        result = func(*args, **kwargs)
-                        last_result = result
-
-                        if result.is_err():
-                            error = result.unwrap_err()
-
-                            # Only retry if error is one of the specified types
-                            if isinstance(error, error_types):
-                                if log_attempts:
-                                    logger.debug(
-                                        f"Attempt {attempt_count} of {func_name} failed with {type(error).__name__}: {error}"
-                                    )
-                                raise error
-                            else:
-                                # Don't retry this error type
-                                if log_attempts:
-                                    logger.debug(
-                                        f"{func_name} failed with non-retryable error {type(error).__name__}: {error}"
-                                    )
-                                return result
-
-                        # Success case or non-retryable error
-                        if log_attempts and attempt_count > 1:
-                            logger.info(
-                                f"{func_name} succeeded after {attempt_count} attempts"
-                            )
-
-                        return result
-
-            except RetryError:
-                if log_attempts:
-                    logger.warning(f"{func_name} failed after {attempt_count} attempts")
-
-                return (
-                    last_result
-                    if last_result is not None
-                    else Err.from_value("All retry attempts failed")
-                )  # type: ignore
-
-            return (
-                last_result
-                if last_result is not None
-                else Err.from_value("Unknown retry error")
-            )  # type: ignore
+            def attempt(attempt_number: int) -> bool:
+                nonlocal last_result
+                last_result = func(*args, **kwargs)
+                return _on_err_type_attempt_done(
+                    last_result, error_types, attempt_number, func_name, log_attempts
+                )
+
+            succeeded, attempt_count = run_attempts(attempt)
+            return _retry_outcome(
+                last_result, succeeded, attempt_count, func_name, log_attempts
+            )
 
         return wrapper
 
@@ -246,48 +440,39 @@ def with_retry[T](
         >>> if result.is_ok():
         ...     value = result.unwrap()
     """
-    wait_strategy = (
-        wait_exponential(multiplier=delay, min=delay, max=30)
-        if backoff
-        else wait_fixed(delay)
-    )
-
-    attempt_count = 0
+    _reject_coroutine_function(func, "awith_retry")
+    result: Result[T, Exception] | None = None
     last_exception: Exception | None = None
 
+    func_name = getattr(func, "__name__", "callable")
     if log_attempts:
-        func_name = Option.of(lambda: func.__name__).unwrap_or("callable")
-        logger.debug(f"Starting retry execution of {func_name}")
+        logger.debug("Starting retry execution of {}", func_name)
+
+    def attempt(attempt_number: int) -> bool:
+        nonlocal result, last_exception
+        try:
+            result = Ok(func())
+        except Exception as e:
+            last_exception = e
+            if log_attempts:
+                logger.debug("Attempt {} failed: {}", attempt_number, e)
+            return False
+        return True
 
-    try:
-        for attempt in Retrying(
-            stop=stop_after_attempt(max_attempts), wait=wait_strategy, reraise=False
-        ):
-            with attempt:
-                attempt_count += 1
-                try:
-                    result = func()
-                    if log_attempts and attempt_count > 1:
-                        logger.info(
-                            f"Function succeeded after {attempt_count} attempts"
-                        )
-                    return Ok(result)
-                except Exception as e:
-                    last_exception = e
-                    if log_attempts:
-                        logger.debug(f"Attempt {attempt_count} failed: {e}")
-                    raise
+    succeeded, attempt_count = _simple_retry_loop(
+        attempt,
+        _wait_schedule(max_attempts, delay, delay, _MAX_BACKOFF if backoff else delay),
+    )
 
-    except RetryError:
-        if log_attempts:
-            logger.warning(f"Function failed after {attempt_count} attempts")
+    if succeeded and result is not None:
+        if log_attempts and attempt_count > 1:
+            logger.info("Function succeeded after {} attempts", attempt_count)
+        return result
 
-        return Err.from_exception(
-            last_exception or Exception("All retry attempts failed")
-        )
+    if log_attempts:
+        logger.warning("Function failed after {} attempts", attempt_count)
 
-    # Shouldn't reach here
-    return Err.from_exception(last_exception or Exception("Unknown retry error"))
+    return Err.from_exception(last_exception or Exception("All retry attempts failed"))
 
 
 def until_ok[T, E](
@@ -317,64 +502,32 @@ def until_ok[T, E](
         >>>
         >>> final_result = until_ok(flaky_operation, max_attempts=5)
     """
-    wait_strategy = (
-        wait_exponential(multiplier=delay, min=delay, max=30)
-        if backoff
-        else wait_fixed(delay)
-    )
-
-    attempt_count = 0
+    _reject_coroutine_function(func, "auntil_ok")
     last_result: Result[T, E] | None = None
 
+    func_name = getattr(func, "__name__", "callable")
     if log_attempts:
-        func_name = Option.of(lambda: func.__name__).unwrap_or("callable")
-        logger.debug(f"Starting retry execution of {func_name}")
+        logger.debug("Starting retry execution of {}", func_name)
 
-    try:
-        for attempt in Retrying(
-            stop=stop_after_attempt(max_attempts), wait=wait_strategy, reraise=False
-        ):
-            with attempt:
-                attempt_count += 1
-                result = func()
-                last_result = result
-
-                if result.is_ok():
-                    if log_attempts and attempt_count > 1:
-                        func_name = Option.of(lambda: func.__name__).unwrap_or(
-                            "callable"
-                        )
-                        logger.info(
-                            f"{func_name} succeeded after {attempt_count} attempts"
-                        )
-                    return result
-                else:
-                    error = result.unwrap_err()
-                    if log_attempts:
-                        logger.debug(f"Attempt {attempt_count} returned Err: {error}")
-
-                    # Create an exception to trigger tenacity retry
-                    if isinstance(error, Exception):
-                        raise error
-                    else:
-                        raise ValueError(f"Operation returned Err: {error}")
+    def attempt(attempt_number: int) -> bool:
+        nonlocal last_result
+        result = last_result = func()
+        if result.is_ok():
+            return True
 
-    except RetryError:
         if log_attempts:
-            func_name = Option.of(lambda: func.__name__).unwrap_or("callable")
-            logger.warning(f"{func_name} failed after {attempt_count} attempts")
-
-        return (
-            last_result
-            if last_result is not None
-            else Err.from_value("All retry attempts failed")
-        )  # type: ignore
+            logger.debug(
+                "Attempt {} returned Err: {}", attempt_number, result.unwrap_err()
+            )
+        return False
 
-    return (
-        last_result
-        if last_result is not None
-        else Err.from_value("Unknown retry error")
-    )  # type: ignore
+    succeeded, attempt_count = _simple_retry_loop(
+        attempt,
+        _wait_schedule(max_attempts, delay, delay, _MAX_BACKOFF if backoff else delay),
+    )
+    return _retry_outcome(
+        last_result, succeeded, attempt_count, func_name, log_attempts
+    )
 
 
 # Convenience functions for common retry patterns
@@ -432,3 +585,230 @@ def retry_if_err(
         return result
 
     return until_ok(func, max_attempts, delay, backoff, log_attempts)
+
+
+# Async variants: the same retry semantics for coroutine functions, waiting
+# with asyncio.sleep so other tasks keep running between attempts
+def aon_err(
+    stop: Any = None,
+    wait: Any = None,
+    log_attempts: bool = True,
+) -> Callable[
+    [Callable[..., Awaitable[Result[T, E]]]], Callable[..., Awaitable[Result[T, E]]]
+]:
+    """Retry an async Result-returning function when it returns Err.
+
+    The async counterpart of :func:`on_err`, with the same defaults.
+
+    Args:
+        stop: Tenacity stop condition (when to stop retrying).
+        wait: Tenacity wait condition (how long to wait between retries).
+        log_attempts: Whether to log retry attempts.
+
+    Examples:
+        >>> import asyncio
+        >>> @aon_err(stop=stop_after_attempt(3))
+        ... async def fetch() -> Result[int, str]:
+        ...     return Ok(42)
+        >>> asyncio.run(fetch()).unwrap()
+        42
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Result[T, E]]],
+    ) -> Callable[..., Awaitable[Result[T, E]]]:
+        run_attempts = _attempt_runner(
+            stop, wait, _async_simple_retry_loop, _async_tenacity_retry_loop
+        )
+        func_name = getattr(func, "__name__", "callable")
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Result[T, E]:
+            last_result: Result[T, E] | None = None
+
+            if log_attempts:
+                logger.debug("Starting retry operation for {}", func_name)
+
+            async def attempt(attempt_number: int) -> bool:
+                nonlocal last_result
+                last_result = await _check_awaitable(
+                    func(*args, **kwargs), attempt_number, func, "on_err"
+                )
+                return _on_err_attempt_done(
+                    last_result, attempt_number, func_name, log_attempts
+                )
+
+            succeeded, attempt_count = await run_attempts(attempt)
+            return _retry_outcome(
+                last_result, succeeded, attempt_count, func_name, log_attempts
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def aon_err_type(
+    *error_types: type[Exception],
+    stop: Any = None,
+    wait: Any = None,
+    log_attempts: bool = True,
+) -> Callable[
+    [Callable[..., Awaitable[Result[T, E]]]], Callable[..., Awaitable[Result[T, E]]]
+]:
+    """Retry an async function only when its Result holds specific exception types.
+
+    The async counterpart of :func:`on_err_type`, with the same defaults.
+
+    Args:
+        error_types: Exception types that should trigger retries.
+        stop: Tenacity stop condition.
+        wait: Tenacity wait condition.
+        log_attempts: Whether to log retry attempts.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Result[T, E]]],
+    ) -> Callable[..., Awaitable[Result[T, E]]]:
+        run_attempts = _attempt_runner(
+            stop, wait, _async_simple_retry_loop, _async_tenacity_retry_loop
+        )
+        func_name = getattr(func, "__name__", "callable")
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Result[T, E]:
+            last_result: Result[T, E] | None = None
+
+            if log_attempts:
+                logger.debug(
+                    "Starting retry operation for {} (retrying on: {})",
+                    func_name,
+                    error_types,
+                )
+
+            async def attempt(attempt_number: int) -> bool:
+                nonlocal last_result
+                last_result = await _check_awaitable(
+                    func(*args, **kwargs), attempt_number, func, "on_err_type"
+                )
+                return _on_err_type_attempt_done(
+                    last_result, error_types, attempt_number, func_name, log_attempts
+                )
+
+            succeeded, attempt_count = await run_attempts(attempt)
+            return _retry_outcome(
+                last_result, succeeded, attempt_count, func_name, log_attempts
+            )
+
+        return wrapper
+
+    return decorator
+
+
+async def awith_retry[T](
+    func: Callable[[], Awaitable[T]],
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: bool = True,
+    log_attempts: bool = True,
+) -> Result[T, Exception]:
+    """Await an async function with simple retry logic, returning a Result.
+
+    The async counterpart of :func:`with_retry`.
+
+    Args:
+        func: The async function to execute with retries.
+        max_attempts: Maximum number of attempts.
+        delay: Base delay between retries in seconds.
+        backoff: Whether to use exponential backoff.
+        log_attempts: Whether to log retry attempts.
+
+    Returns:
+        Ok(result) if successful, Err(exception) if all attempts failed.
+    """
+    result: Result[T, Exception] | None = None
+    last_exception: Exception | None = None
+
+    func_name = getattr(func, "__name__", "callable")
+    if log_attempts:
+        logger.debug("Starting retry execution of {}", func_name)
+
+    async def attempt(attempt_number: int) -> bool:
+        nonlocal result, last_exception
+        try:
+            result = Ok(
+                await _check_awaitable(func(), attempt_number, func, "with_retry")
+            )
+        except _NotAwaitableError:
+            raise
+        except Exception as e:
+            last_exception = e
+            if log_attempts:
+                logger.debug("Attempt {} failed: {}", attempt_number, e)
+            return False
+        return True
+
+    succeeded, attempt_count = await _async_simple_retry_loop(
+        attempt,
+        _wait_schedule(max_attempts, delay, delay, _MAX_BACKOFF if backoff else delay),
+    )
+
+    if succeeded and result is not None:
+        if log_attempts and attempt_count > 1:
+            logger.info("Function succeeded after {} attempts", attempt_count)
+        return result
+
+    if log_attempts:
+        logger.warning("Function failed after {} attempts", attempt_count)
+
+    return Err.from_exception(last_exception or Exception("All retry attempts failed"))
+
+
+async def auntil_ok[T, E](
+    func: Callable[[], Awaitable[Result[T, E]]],
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: bool = True,
+    log_attempts: bool = True,
+) -> Result[T, E]:
+    """Retry an async Result-returning function until it returns Ok.
+
+    The async counterpart of :func:`until_ok`.
+
+    Args:
+        func: Async function that returns a Result.
+        max_attempts: Maximum number of attempts.
+        delay: Base delay between retries.
+        backoff: Whether to use exponential backoff.
+        log_attempts: Whether to log attempts.
+
+    Returns:
+        The first Ok result, or the last Err if all attempts fail.
+    """
+    last_result: Result[T, E] | None = None
+
+    func_name = getattr(func, "__name__", "callable")
+    if log_attempts:
+        logger.debug("Starting retry execution of {}", func_name)
+
+    async def attempt(attempt_number: int) -> bool:
+        nonlocal last_result
+        result = last_result = await _check_awaitable(
+            func(), attempt_number, func, "until_ok"
+        )
+        if result.is_ok():
+            return True
+
+        if log_attempts:
+            logger.debug(
+                "Attempt {} returned Err: {}", attempt_number, result.unwrap_err()
+            )
+        return False
+
+    succeeded, attempt_count = await _async_simple_retry_loop(
+        attempt,
+        _wait_schedule(max_attempts, delay, delay, _MAX_BACKOFF if backoff else delay),
+    )
+    return _retry_outcome(
+        last_result, succeeded, attempt_count, func_name, log_attempts
+    )
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any, TypeVar
 
 from ..result import Result
@@ -59,3 +59,44 @@ def standard[T](func: Callable[[], T]) -> Result[T, Exception]:
 def persistent[T](func: Callable[[], T]) -> Result[T, Exception]:
     """Persistent retry for important operations."""
     ...
+
+def aon_err(
+    stop: Any = None,
+    wait: Any = None,
+    log_attempts: bool = True,
+) -> Callable[
+    [Callable[..., Awaitable[Result[T, E]]]], Callable[..., Awaitable[Result[T, E]]]
+]:
+    """Retry an async Result-returning function when it returns Err."""
+    ...
+
+def aon_err_type(
+    *error_types: type[Exception],
+    stop: Any = None,
+    wait: Any = None,
+    log_attempts: bool = True,
+) -> Callable[
+    [Callable[..., Awaitable[Result[T, E]]]], Callable[..., Awaitable[Result[T, E]]]
+]:
+    """Retry an async function only when its Result holds specific exception types."""
+    ...
+
+async def awith_retry[T](
+    func: Callable[[], Awaitable[T]],
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: bool = True,
+    log_attempts: bool = True,
+) -> Result[T, Exception]:
+    """Await an async function with simple retry logic, returning a Result."""
+    ...
+
+async def auntil_ok[T, E](
+    func: Callable[[], Awaitable[Result[T, E]]],
+    max_attempts: int = 3,
+    delay: float = 1.0,
+    backoff: bool = True,
+    log_attempts: bool = True,
+) -> Result[T, E]:
+    """Retry an async Result-returning function until it returns Ok."""
+    ...
@@ -7,9 +7,10 @@ through loguru, configurable via confection.
 
 from __future__ import annotations
 
-import inspect
-from abc import ABC, abstractmethod
+import sys
 from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, TypeVar
 
 if TYPE_CHECKING:
@@ -24,7 +25,17 @@ E = TypeVar("E")
 U = TypeVar("U")
 
 
-class Result[T, E](ABC):
+@lru_cache(maxsize=1024)
+def _file_name(filename: str) -> str:
+    """Return the base name of a code object's filename.
+
+    Logged Err/Nothing values come from a small, stable set of call sites, so
+    caching on co_filename saves building a Path for every logged value.
+    """
+    return Path(filename).name
+
+
+class Result[T, E]:
     """A type that represents either success (Ok) or failure (Err).
 
     Result<T, E> is similar to Rust's Result type, providing a way to handle
@@ -56,7 +67,8 @@ class Result[T, E](ABC):
         '10'
     """
 
-    @abstractmethod
+    __slots__ = ()
+
     def is_ok(self) -> bool:
         """Check if this Result contains a success value.
 
@@ -69,9 +81,8 @@ class Result[T, E](ABC):
             >>> Err("error").is_ok()
             False
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def is_err(self) -> bool:
         """Check if this Result contains an error value.
 
@@ -84,9 +95,8 @@ class Result[T, E](ABC):
             >>> Err("error").is_err()
             True
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T:
         """Extract the success value, raising an exception if this is an Err.
 
@@ -103,9 +113,8 @@ class Result[T, E](ABC):
             Traceback (most recent call last):
             RuntimeError: Called unwrap on Err: failed
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_err(self) -> E:
         """Extract the error value, raising an exception if this is an Ok.
 
@@ -122,9 +131,8 @@ class Result[T, E](ABC):
             Traceback (most recent call last):
             RuntimeError: Called unwrap_err on Ok: 42
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T) -> T:
         """Extract the success value or return a default.
 
@@ -140,9 +148,8 @@ class Result[T, E](ABC):
             >>> Err("failed").unwrap_or(0)
             0
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or_else(self, f: Callable[[E], T]) -> T:
         """Extract the success value or compute one from the error.
 
@@ -158,9 +165,8 @@ class Result[T, E](ABC):
             >>> Err("failed").unwrap_or_else(lambda e: len(str(e)))
             6
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def map[U](self, f: Callable[[T], U]) -> Result[U, E]:
         """Transform the success value if present.
 
@@ -182,9 +188,8 @@ class Result[T, E](ABC):
             >>> Err("failed").map(lambda x: x * 2)
             Err('failed')
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def map_err[U](self, f: Callable[[E], U]) -> Result[T, U]:
         """Transform the error value if present.
 
@@ -204,9 +209,8 @@ class Result[T, E](ABC):
             >>> Err(404).map_err(str)
             Err('404')
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def then[U](self, f: Callable[[T], Result[U, E]]) -> Result[U, E]:
         """Chain Result-returning operations (also known as flatmap).
 
@@ -230,9 +234,8 @@ class Result[T, E](ABC):
             >>> Ok(0).then(divide)
             Err('division by zero')
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def or_else[U](self, f: Callable[[E], Result[T, U]]) -> Result[T, U]:
         """Chain Result-returning operations on the error case.
 
@@ -258,9 +261,8 @@ class Result[T, E](ABC):
             >>> Err("failed").unwrap_or(42)
             42
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __iter__(self) -> Iterator[T]:
         """Iterate over the Ok value, 0 or 1 times.
 
@@ -277,9 +279,8 @@ class Result[T, E](ABC):
             >>> list(Err("boom"))
             []
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def zip[U](self, other: Result[U, E]) -> Result[tuple[T, U], E]:
         """Combine this Result with another into a Result of a tuple.
 
@@ -296,9 +297,8 @@ class Result[T, E](ABC):
             >>> Ok(1).zip(Err("boom"))  # doctest: +ELLIPSIS
             Err(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def flatten(self: Result[Result[T, E], E]) -> Result[T, E]:
         """Flatten a nested Result by one level.
 
@@ -309,9 +309,8 @@ class Result[T, E](ABC):
             >>> Ok(Ok(42)).flatten()
             Ok(42)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def and_[U](self, other: Result[U, E]) -> Result[U, E]:
         """Return `other` if this is Ok, otherwise this Err.
 
@@ -327,9 +326,8 @@ class Result[T, E](ABC):
             >>> Err("boom").and_(Ok("a"))  # doctest: +ELLIPSIS
             Err(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def or_[F](self, other: Result[T, F]) -> Result[T, F]:
         """Return this Result if Ok, otherwise `other`.
 
@@ -346,9 +344,8 @@ class Result[T, E](ABC):
             >>> Err("primary").or_(Ok(2))
             Ok(2)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def ok(self) -> Option[T]:
         """Convert this Result into an Option, discarding any error.
 
@@ -361,9 +358,8 @@ class Result[T, E](ABC):
             >>> Err("boom").ok()  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def err(self) -> Option[E]:
         """Convert this Result into an Option of its error.
 
@@ -376,9 +372,8 @@ class Result[T, E](ABC):
             >>> Ok(42).err()  # doctest: +ELLIPSIS
             Nothing(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __hash__(self) -> int:
         """Hash this Result, consistent with __eq__.
 
@@ -390,9 +385,8 @@ class Result[T, E](ABC):
             >>> hash(Ok(1)) == hash(Ok(1))
             True
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __bool__(self) -> bool:
         """Return whether this Result is truthy.
 
@@ -405,9 +399,8 @@ class Result[T, E](ABC):
             >>> bool(Err("boom"))
             False
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __len__(self) -> int:
         """Return the number of contained success values (0 or 1).
 
@@ -422,9 +415,8 @@ class Result[T, E](ABC):
             >>> len(Err("boom"))
             0
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __contains__(self, item: object) -> bool:
         """Check whether `item` equals the contained Ok value.
 
@@ -443,9 +435,8 @@ class Result[T, E](ABC):
             >>> 42 in Err("boom")
             False
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __and__[U](self, other: Result[U, E]) -> Result[U, E]:
         """Thin delegate to and_() - return `other` if this is Ok, otherwise this Err.
 
@@ -461,9 +452,8 @@ class Result[T, E](ABC):
             >>> Err("boom") & Ok("a")  # doctest: +ELLIPSIS
             Err(...)
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def __or__[F](self, other: Result[T, F]) -> Result[T, F]:
         """Thin delegate to or_() - return this Result if Ok, otherwise `other`.
 
@@ -480,7 +470,7 @@ class Result[T, E](ABC):
             >>> Err("primary") | Ok(2)
             Ok(2)
         """
-        pass
+        raise NotImplementedError
 
     @classmethod
     def of(cls, f: Callable[[], T]) -> Result[T, Exception]:
@@ -590,6 +580,7 @@ class Ok[T, E](Result[T, E]):
         Ok(5)
     """
 
+    __slots__ = ("_value",)
     __match_args__ = ("_value",)
 
     def __init__(self, value: T) -> None:
@@ -702,36 +693,46 @@ class Ok[T, E](Result[T, E]):
         return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
-        match other:
-            case Ok(other_value):
-                try:
-                    result = self._value < other_value
-                    return bool(result)
-                except TypeError:
-                    return NotImplemented
-            case Err():
-                return False  # Ok is always greater than Err
-            case _:
+        if isinstance(other, Ok):
+            try:
+                return bool(self._value < other._value)
+            except TypeError:
                 return NotImplemented
+        if isinstance(other, Err):
+            return False  # Ok is always greater than Err
+        return NotImplemented
 
     def __le__(self, other: object) -> bool:
-        return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, Ok):
+            try:
+                return bool(self._value <= other._value)
+            except TypeError:
+                # Values that only define == and < still order as before
+                return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, Err):
+            return False  # Ok is always greater than Err
+        return NotImplemented
 
     def __gt__(self, other: object) -> bool:
-        match other:
-            case Ok(other_value):
-                try:
-                    result = self._value > other_value
-                    return bool(result)
-                except TypeError:
-                    return NotImplemented
-            case Err():
-                return True  # Ok is always greater than Err
-            case _:
+        if isinstance(other, Ok):
+            try:
+                return bool(self._value > other._value)
+            except TypeError:
                 return NotImplemented
+        if isinstance(other, Err):
+            return True  # Ok is always greater than Err
+        return NotImplemented
 
     def __ge__(self, other: object) -> bool:
-        return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Ok):
+            try:
+                return bool(self._value >= other._value)
+            except TypeError:
+                # Values that only define == and > still order as before
+                return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Err):
+            return True  # Ok is always greater than Err
+        return NotImplemented
 
 
 class Err[T, E](Result[T, E]):
@@ -764,6 +765,7 @@ class Err[T, E](Result[T, E]):
         True
     """
 
+    __slots__ = ("_error",)
     __match_args__ = ("_error",)
 
     def __init__(self, error: E, *, _skip_logging: bool = False) -> None:
@@ -774,40 +776,45 @@ class Err[T, E](Result[T, E]):
             _skip_logging: If True, skip automatic error logging.
         """
         self._error = error
-        if not _skip_logging:
+        # Logging is the cold path: with it disabled, construction is just
+        # the attribute writes above
+        if not _skip_logging and should_log():
             self._log_error()
 
     def _log_error(self) -> None:
-        """Log the error using configured logging settings."""
-        # Check if logging is enabled globally
-        if not should_log():
-            return
-
-        # Get the calling frame to capture basic context
-        frame = inspect.currentframe()
-        caller_frame = None
+        """Log the error using configured logging settings.
 
-        if frame and frame.f_back and frame.f_back.f_back:
-            caller_frame = frame.f_back.f_back
-
-        # Capture basic context
-        context: dict[str, Any] = {}
-        if caller_frame:
-            from pathlib import Path
-
-            context["function"] = caller_frame.f_code.co_name
-            context["file"] = Path(caller_frame.f_code.co_filename).name
-            context["line"] = caller_frame.f_lineno
+        Only called from __init__ once should_log() has passed.
+        """
+        # Get the calling frame to capture basic context: skip this method
+        # and __init__ with a single C call rather than walking inspect frames
+        try:
+            caller_frame = sys._getframe(2)
+        except ValueError:
+            caller_frame = None
+
+        # Bind the caller's context directly from the frame, rather than
+        # filling a dict and reading it back for the message
+        if caller_frame is None:
+            location = "<?>:?"
+            bound_logger = logger
+        else:
+            code = caller_frame.f_code
+            location = f"{code.co_name}:{caller_frame.f_lineno}"
+            bound_logger = logger.bind(
+                function=code.co_name,
+                file=_file_name(code.co_filename),
+                line=caller_frame.f_lineno,
+            )
 
         # Get log level
         log_level = get_log_level()
 
         # Build simple log message
-        location = f"{context.get('function', '<?>')}:{context.get('line', '?')}"
         message = f"Result error in {location} - {self._error}"
 
         # Log at the configured level
-        logger.bind(**context).log(log_level, message)
+        bound_logger.log(log_level, message)
 
     @classmethod
     def from_exception(cls, exception: Exception) -> Err[Any, Exception]:
@@ -958,36 +965,46 @@ class Err[T, E](Result[T, E]):
         return not self.__eq__(other)
 
     def __lt__(self, other: object) -> bool:
-        match other:
-            case Err(other_error):
-                try:
-                    result = self._error < other_error
-                    return bool(result)
-                except TypeError:
-                    return NotImplemented
-            case Ok():
-                return True  # Err is always less than Ok
-            case _:
+        if isinstance(other, Err):
+            try:
+                return bool(self._error < other._error)
+            except TypeError:
                 return NotImplemented
+        if isinstance(other, Ok):
+            return True  # Err is always less than Ok
+        return NotImplemented
 
     def __le__(self, other: object) -> bool:
-        return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, Err):
+            try:
+                return bool(self._error <= other._error)
+            except TypeError:
+                # Values that only define == and < still order as before
+                return self.__eq__(other) or self.__lt__(other)
+        if isinstance(other, Ok):
+            return True  # Err is always less than Ok
+        return NotImplemented
 
     def __gt__(self, other: object) -> bool:
-        match other:
-            case Err(other_error):
-                try:
-                    result = self._error > other_error
-                    return bool(result)
-                except TypeError:
-                    return NotImplemented
-            case Ok():
-                return False  # Err is never greater than Ok
-            case _:
+        if isinstance(other, Err):
+            try:
+                return bool(self._error > other._error)
+            except TypeError:
                 return NotImplemented
+        if isinstance(other, Ok):
+            return False  # Err is never greater than Ok
+        return NotImplemented
 
     def __ge__(self, other: object) -> bool:
-        return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Err):
+            try:
+                return bool(self._error >= other._error)
+            except TypeError:
+                # Values that only define == and > still order as before
+                return self.__eq__(other) or self.__gt__(other)
+        if isinstance(other, Ok):
+            return False  # Err is never greater than Ok
+        return NotImplemented
 
 
 # Factory functions for creating Results
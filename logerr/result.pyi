@@ -12,6 +12,8 @@ T = TypeVar("T")
 E = TypeVar("E")
 U = TypeVar("U")
 
+def _file_name(filename: str) -> str: ...
+
 class Result[T, E](ABC):
     """Abstract base class for Result types."""
 
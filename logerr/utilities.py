@@ -9,15 +9,14 @@ parameter resolution, exception-safe chaining, and simple logging.
 from __future__ import annotations
 
 import sys
-from collections.abc import Callable
-from pathlib import Path
+from collections.abc import Callable, Iterable
 from typing import Any, Literal, overload
 
 from loguru import logger
 
-from .config import get_log_level, should_log
+from .config import _VALID_LEVELS, get_log_level, should_log
 from .option import Nothing, Option, Some
-from .result import Err, Ok, Result
+from .result import Err, Ok, Result, _file_name
 
 
 @overload
@@ -193,7 +192,7 @@ def log(
     # Create context dictionary with basic info
     context: dict[str, Any] = {
         "function": function_name,
-        "file": Path(filename).name,
+        "file": _file_name(filename),
         "line": str(line_number),
     }
 
@@ -203,11 +202,7 @@ def log(
 
     # Get the appropriate log level
     effective_level = get_log_level()
-    actual_level = (
-        log_level
-        if log_level in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        else effective_level
-    )
+    actual_level = log_level if log_level in _VALID_LEVELS else effective_level
 
     # Log with context
     logger.bind(**context).log(actual_level, message)
@@ -288,6 +283,88 @@ def validate[T, E](
             raise
 
 
+def _reject(value: Any) -> bool:
+    """Predicate for values already known to have failed validation."""
+    return False
+
+
+@overload
+def validate_many[T, E](
+    values: Iterable[T],
+    predicate: Callable[[T], bool],
+    *,
+    error_factory: Callable[[T], E] | E,
+    return_type: Literal["result"] = "result",
+    capture_exceptions: bool = True,
+) -> list[Result[T, E | Exception]]: ...
+@overload
+def validate_many[T, E](
+    values: Iterable[T],
+    predicate: Callable[[T], bool],
+    *,
+    error_factory: Callable[[T], E] | E,
+    return_type: Literal["option"],
+    capture_exceptions: bool = True,
+) -> list[Option[T]]: ...
+def validate_many[T, E](
+    values: Iterable[T],
+    predicate: Callable[[T], bool],
+    *,
+    error_factory: Callable[[T], E] | E,
+    return_type: Literal["option", "result"] = "result",
+    capture_exceptions: bool = True,
+) -> list[Any]:  # list[Option[T]] | list[Result[T, E | Exception]]
+    """Validate each of a batch of values, as validate() does for one value.
+
+    When the predicate is a NumPy ufunc (e.g. ``numpy.isfinite``) it is
+    applied to the whole batch in one call, and only the values that fail
+    go through validate() to build their errors. Any other predicate, or a
+    ufunc that can't handle the batch as an array, is called per value.
+
+    Args:
+        values: The values to validate
+        predicate: Function that tests a value
+        error_factory: Callable to create error from value, or error value directly
+        return_type: Whether to return Option or Result types
+        capture_exceptions: Whether to catch exceptions in predicate execution
+
+    Returns:
+        One Option[T] or Result[T, E | Exception] per value, in order
+
+    Examples:
+        >>> results = validate_many([1, -2], lambda x: x > 0, error_factory="negative")
+        >>> [r.is_ok() for r in results]
+        [True, False]
+    """
+    values = list(values)
+    options = {"error_factory": error_factory, "capture_exceptions": capture_exceptions}
+
+    # A ufunc predicate means numpy is already imported
+    mask = None
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(predicate, np.ufunc):
+        try:
+            array_mask = np.asarray(predicate(np.asarray(values)), dtype=bool)
+            if array_mask.shape == (len(values),):
+                mask = array_mask.tolist()
+        except Exception:
+            mask = None
+
+    if mask is None:
+        return [
+            validate(value, predicate, return_type=return_type, **options)  # type: ignore
+            for value in values
+        ]
+
+    passed = Some if return_type == "option" else Ok
+    return [
+        passed(value)
+        if ok
+        else validate(value, _reject, return_type=return_type, **options)  # type: ignore
+        for value, ok in zip(values, mask, strict=True)
+    ]
+
+
 def resolve[T](
     provided: T | None, default: T, *, validator: Callable[[T], bool] | None = None
 ) -> T:
@@ -383,8 +460,11 @@ def attribute(obj: Any, attr_name: str, default: Any = "unknown") -> Any:
         >>> attribute(42, "__name__", "unknown")
         'unknown'
     """
-
-    return Option.of(lambda: getattr(obj, attr_name)).unwrap_or(default)  # type: ignore
+    try:
+        value = getattr(obj, attr_name)
+    except Exception:
+        return default
+    return default if value is None else value
 
 
 def error(
@@ -442,26 +522,65 @@ def pipe[T](value: T, *functions: Callable[[Any], Any]) -> Result[Any, Exception
         >>> result.unwrap()
         ['HELLO', 'WORLD']
     """
-    result = value
-    for func in functions:
-        step = Result.of(lambda f=func, r=result: f(r))
-        if step.is_err():
-            return step
-        result = step.unwrap()
-    return Ok(result)
+    return compile_pipe(*functions)(value)
+
+
+def compile_pipe(
+    *functions: Callable[[Any], Any],
+) -> Callable[[Any], Result[Any, Exception]]:
+    """Build a reusable pipeline that applies functions like pipe().
+
+    pipe() with the same functions gives the same results, but a compiled
+    pipeline runs every step inside a single try block instead of wrapping
+    each step in its own Result. Build it once and call it for each value
+    when the same steps are applied to many values.
+
+    Args:
+        *functions: Functions to apply in sequence
+
+    Returns:
+        A callable taking the initial value and returning Ok(final_result), or
+        Err(exception) from the first step that raised.
+
+    Examples:
+        >>> from logerr.utilities import compile_pipe
+        >>> clean = compile_pipe(str.strip, str.lower)
+        >>> [clean(s).unwrap() for s in ["  Foo ", "BAR  "]]
+        ['foo', 'bar']
+        >>> compile_pipe(int)("nope").is_err()
+        True
+    """
+
+    def pipeline(value: Any) -> Result[Any, Exception]:
+        try:
+            for func in functions:
+                value = func(value)
+        except Exception as e:
+            return Err.from_exception(e)
+        return Ok(value)
+
+    return pipeline
 
 
-def try_chain[T](*callables: Callable[[], T]) -> Option[T]:
+def try_chain[T](
+    *callables: Callable[[], T] | tuple[Callable[[], bool], Callable[[], T]],
+) -> Option[T]:
     """Try a series of callables until one succeeds.
 
     Useful for fallback patterns where you want to try multiple approaches.
+    A callable can be paired with a guard as ``(guard, callable)``; when the
+    guard returns False the callable is skipped, so an approach that is known
+    not to apply doesn't have to raise to be passed over.
 
     Args:
-        *callables: Functions to try in order
+        *callables: Functions to try in order, or (guard, function) pairs
 
     Returns:
         Some(result) from first successful callable, Nothing if all fail
 
+    Raises:
+        TypeError: If an item is neither a callable nor a pair of callables
+
     Examples:
         >>> from logerr.utilities import try_chain
         >>> result = try_chain(
@@ -470,11 +589,30 @@ def try_chain[T](*callables: Callable[[], T]) -> Option[T]:
         ... )
         >>> result.unwrap()
         42
+
+        >>> text = "0x2a"
+        >>> try_chain(
+        ...     (text.isdigit, lambda: int(text)),  # Skipped, no exception
+        ...     lambda: int(text, 16),
+        ... ).unwrap()
+        42
     """
-    for callable_func in callables:
+    for item in callables:
+        if isinstance(item, tuple):
+            if len(item) != 2 or not all(map(callable, item)):
+                raise TypeError(
+                    "try_chain pairs must be (guard, callable) tuples of callables"
+                )
+            guard, callable_func = item
+        elif callable(item):
+            guard, callable_func = None, item
+        else:
+            raise TypeError(f"try_chain expected a callable, got {item!r}")
+
         try:
-            result = callable_func()
-            return Some(result)
+            if guard is not None and not guard():
+                continue
+            return Some(callable_func())
         except Exception:
             continue
     return Nothing.from_none("All callables failed")
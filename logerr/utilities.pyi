@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any, Literal, TypeVar, overload
 
 from .option import Option
@@ -86,6 +86,30 @@ def validate[T, E](
     """Validate values using predicates with flexible error handling."""
     ...
 
+@overload
+def validate_many[T, E](
+    values: Iterable[T],
+    predicate: Callable[[T], bool],
+    *,
+    error_factory: Callable[[T], E] | E,
+    return_type: Literal["result"] = "result",
+    capture_exceptions: bool = True,
+) -> list[Result[T, E | Exception]]:
+    """Validate each of a batch of values, as validate() does for one value."""
+    ...
+
+@overload
+def validate_many[T, E](
+    values: Iterable[T],
+    predicate: Callable[[T], bool],
+    *,
+    error_factory: Callable[[T], E] | E,
+    return_type: Literal["option"],
+    capture_exceptions: bool = True,
+) -> list[Option[T]]:
+    """Validate each of a batch of values, as validate() does for one value."""
+    ...
+
 def resolve[T](
     provided: T | None, default: T, *, validator: Callable[[T], bool] | None = None
 ) -> T:
@@ -116,6 +140,14 @@ def pipe[T](value: T, *functions: Callable[[Any], Any]) -> Result[Any, Exception
     """Apply a series of functions in pipeline fashion."""
     ...
 
-def try_chain[T](*callables: Callable[[], T]) -> Option[T]:
+def compile_pipe(
+    *functions: Callable[[Any], Any],
+) -> Callable[[Any], Result[Any, Exception]]:
+    """Build a reusable pipeline that applies functions like pipe()."""
+    ...
+
+def try_chain[T](
+    *callables: Callable[[], T] | tuple[Callable[[], bool], Callable[[], T]],
+) -> Option[T]:
     """Try a series of callables until one succeeds."""
     ...
@@ -11,6 +11,7 @@ from hypothesis import strategies as st
 from logerr.recipes.dataframes.conversion import (
     convert_bson_value,
     convert_document_to_row,
+    convert_documents_to_columns,
     infer_schema_from_documents,
     normalize_field_name,
     prepare_dataframe_dtypes,
@@ -183,6 +184,18 @@ class TestConvertBsonValueDatetime:
         result = convert_bson_value("2024-01-15 10:30:00.123456", datetime, "field")
         assert result.unwrap() == datetime(2024, 1, 15, 10, 30, 0, 123456)
 
+    def test_iso_format_with_z_string_is_naive(self):
+        result = convert_bson_value("2024-01-15T10:30:00Z", datetime, "field")
+        assert result.unwrap().tzinfo is None
+
+    def test_non_padded_string_falls_back_to_strptime(self):
+        result = convert_bson_value("2024-1-5", datetime, "field")
+        assert result.unwrap() == datetime(2024, 1, 5)
+
+    def test_invalid_iso_shaped_string_fails(self):
+        result = convert_bson_value("2024-13-45", datetime, "field")
+        assert result.is_nothing()
+
     def test_unparseable_string_fails(self):
         result = convert_bson_value("not-a-date", datetime, "field")
         assert result.is_nothing()
@@ -279,6 +292,11 @@ class TestInferSchemaFromDocuments:
         schema = infer_schema_from_documents(docs)
         assert schema == {"name": str, "age": int, "active": bool}
 
+    def test_tied_types_resolve_to_first_seen(self):
+        docs = [{"value": 1}, {"value": "a"}, {"value": "b"}, {"value": 2}]
+        schema = infer_schema_from_documents(docs)
+        assert schema == {"value": int}
+
     def test_most_common_type_wins(self):
         docs = [
             {"value": "a"},
@@ -421,6 +439,82 @@ class TestConvertDocumentToRow:
         assert result.is_err()
 
 
+class TestConvertDocumentsToColumns:
+    """Tests for convert_documents_to_columns."""
+
+    def _fields(self, **kwargs):
+        """Build FieldSpec list from name=(type, required) kwargs."""
+        return [
+            FieldSpec(name=name, field_type=t, is_required=req)
+            for name, (t, req) in kwargs.items()
+        ]
+
+    def test_columns_hold_converted_values(self):
+        fields = self._fields(name=(str, False), age=(int, False))
+        docs = [{"name": "Alice", "age": "30"}, {"name": "Bob"}]
+        columns, errors = convert_documents_to_columns(docs, fields)
+
+        assert columns == {"name": ["Alice", "Bob"], "age": [30, None]}
+        assert errors == []
+
+    def test_documents_missing_required_fields_are_dropped(self):
+        fields = self._fields(user_id=(str, True), email=(str, True))
+        docs = [{"user_id": "u1", "email": "a@b"}, {}, {"user_id": "u3"}]
+        columns, errors = convert_documents_to_columns(docs, fields)
+
+        assert columns == {"user_id": ["u1"], "email": ["a@b"]}
+        assert errors == [
+            "Missing required fields: ['user_id', 'email']",
+            "Missing required fields: ['email']",
+        ]
+
+    def test_exact_type_values_skip_conversion(self, monkeypatch):
+        from logerr.recipes.dataframes import conversion
+
+        calls = []
+        original = conversion._CONVERTERS[int]
+
+        def spy(value, target_type):
+            calls.append(value)
+            return original(value, target_type)
+
+        monkeypatch.setitem(conversion._CONVERTERS, int, spy)
+        fields = self._fields(age=(int, False))
+        columns, _ = convert_documents_to_columns([{"age": 1}, {"age": "2"}], fields)
+
+        assert columns == {"age": [1, 2]}
+        assert calls == ["2"]
+
+    def test_quality_tracker_records_documents_and_presence(self):
+        tracker = DataQualityTracker("op")
+        fields = self._fields(name=(str, False), age=(int, False))
+        docs = [{"name": "Alice", "age": None}, {"name": "Bob"}, {"other": 1}]
+        convert_documents_to_columns(docs, fields, tracker)
+
+        assert tracker.total_records == 3
+        assert tracker.field_presence == {"name": 2}
+
+    def test_quality_tracker_records_conversion_errors_once_per_field(
+        self, monkeypatch
+    ):
+        tracker = DataQualityTracker("op")
+        batches = []
+        monkeypatch.setattr(
+            tracker,
+            "record_conversion_errors",
+            lambda *args: batches.append(args),
+        )
+        fields = self._fields(count=(int, False))
+        docs = [{"count": "bad"}, {"count": 1}, {"count": "worse"}]
+        columns, _ = convert_documents_to_columns(docs, fields, tracker)
+
+        assert columns == {"count": [None, 1, None]}
+        assert len(batches) == 1
+        field_name, values, errors = batches[0]
+        assert (field_name, values) == ("count", ["bad", "worse"])
+        assert all(isinstance(e, ValueError) for e in errors)
+
+
 class TestNormalizeFieldName:
     """Tests for normalize_field_name."""
 
@@ -446,6 +540,9 @@ class TestNormalizeFieldName:
         result = normalize_field_name("$$$")
         assert result == "___"
 
+    def test_non_ascii_word_characters_kept(self):
+        assert normalize_field_name("prénom.données") == "prénom_données"
+
     def test_underscore_prefixed_names_kept(self):
         assert normalize_field_name("_id") == "_id"
 
@@ -530,6 +627,22 @@ class TestConversionProperties:
         assert result.is_ok()
         assert set(result.unwrap().keys()) == set(fields_names(fields))
 
+    @given(st.lists(document_strategy, max_size=10), st.data())
+    def test_columns_match_row_conversion(self, documents, data):
+        schema = infer_schema_from_documents(documents)
+        fields = [
+            FieldSpec(name=name, field_type=t, is_required=data.draw(st.booleans()))
+            for name, t in schema.items()
+        ]
+
+        results = [convert_document_to_row(doc, fields) for doc in documents]
+        rows = [r.unwrap() for r in results if r.is_ok()]
+        errors = [r.unwrap_err() for r in results if r.is_err()]
+        columns, column_errors = convert_documents_to_columns(documents, fields)
+
+        assert column_errors == errors
+        assert columns == {f.name: [row[f.name] for row in rows] for f in fields}
+
 
 def fields_names(fields):
     return [f.name for f in fields]
@@ -20,7 +20,8 @@ from logerr.recipes.dataframes.mongo import (
     _create_empty_dataframe,
     _create_pandas_dataframe,
     _documents_to_dataframe,
-    _execute_mongo_query,
+    _iter_document_batches,
+    _open_mongo_query,
     from_mongo,
     from_mongo_cursor,
 )
@@ -37,6 +38,8 @@ class FakeCursor:
     def __init__(self, documents: list[dict[str, Any]], fail_on_iterate: bool = False):
         self._documents = documents
         self._limit: int | None = None
+        self._skip = 0
+        self._sort_key: str | None = None
         self._batch_size: int | None = None
         self.fail_on_iterate = fail_on_iterate
 
@@ -44,6 +47,14 @@ class FakeCursor:
         self._limit = n
         return self
 
+    def skip(self, n: int) -> FakeCursor:
+        self._skip = n
+        return self
+
+    def sort(self, key: str, direction: int) -> FakeCursor:
+        self._sort_key = key
+        return self
+
     def batch_size(self, n: int) -> FakeCursor:
         self._batch_size = n
         return self
@@ -52,6 +63,9 @@ class FakeCursor:
         if self.fail_on_iterate:
             raise ConnectionError("mongo connection lost")
         docs = self._documents
+        if self._sort_key is not None:
+            docs = sorted(docs, key=lambda doc: doc[self._sort_key])
+        docs = docs[self._skip :]
         if self._limit is not None:
             docs = docs[: self._limit]
         return iter(docs)
@@ -79,6 +93,12 @@ class FakeCollection:
             raise ConnectionError("could not connect to mongo")
         return FakeCursor(self.documents, fail_on_iterate=self.fail_on_iterate)
 
+    def count_documents(self, query: dict[str, Any]) -> int:
+        self.last_query = query
+        if self.fail_on_find:
+            raise ConnectionError("could not connect to mongo")
+        return len(self.documents)
+
 
 class FailingIterable:
     """An iterable that raises when iteration is attempted (for cursor tests)."""
@@ -87,29 +107,60 @@ class FailingIterable:
         raise TimeoutError("cursor timed out")
 
 
-class TestExecuteMongoQuery:
-    """Tests for the internal _execute_mongo_query helper."""
+class TestOpenMongoQuery:
+    """Tests for the internal _open_mongo_query helper."""
 
     def test_returns_documents(self):
         collection = FakeCollection([{"a": 1}, {"a": 2}])
-        result = _execute_mongo_query(collection, {}, None, 1000)
+        result = list(_open_mongo_query(collection, {}, None, 1000))
         assert result == [{"a": 1}, {"a": 2}]
 
     def test_applies_limit(self):
         collection = FakeCollection([{"a": 1}, {"a": 2}, {"a": 3}])
-        result = _execute_mongo_query(collection, {}, 2, 1000)
+        result = list(_open_mongo_query(collection, {}, 2, 1000))
         assert result == [{"a": 1}, {"a": 2}]
 
     def test_passes_query_through(self):
         collection = FakeCollection([{"a": 1}])
-        _execute_mongo_query(collection, {"status": "active"}, None, 1000)
+        _open_mongo_query(collection, {"status": "active"}, None, 1000)
         assert collection.last_query == {"status": "active"}
 
     def test_no_batch_size_skips_call(self):
         collection = FakeCollection([{"a": 1}])
-        result = _execute_mongo_query(collection, {}, None, 0)
+        result = list(_open_mongo_query(collection, {}, None, 0))
         assert result == [{"a": 1}]
 
+    def test_batch_size_only_forwarded_when_given(self):
+        collection = FakeCollection([{"a": 1}])
+        assert _open_mongo_query(collection, {}, None, None)._batch_size is None
+        assert _open_mongo_query(collection, {}, None, 50)._batch_size == 50
+
+
+class TestIterDocumentBatches:
+    """Tests for the internal _iter_document_batches helper."""
+
+    def test_splits_into_batches(self):
+        docs = [{"a": i} for i in range(5)]
+        batches = list(_iter_document_batches(iter(docs), 2))
+        assert batches == [docs[0:2], docs[2:4], docs[4:5]]
+
+    def test_non_positive_batch_size_uses_default(self):
+        docs = [{"a": i} for i in range(5)]
+        assert list(_iter_document_batches(docs, 0)) == [docs]
+        assert list(_iter_document_batches(docs, None)) == [docs]
+
+    def test_reads_lazily(self):
+        consumed = []
+
+        def cursor():
+            for i in range(4):
+                consumed.append(i)
+                yield {"a": i}
+
+        batches = _iter_document_batches(cursor(), 2)
+        next(batches)
+        assert consumed == [0, 1]
+
 
 class TestFromMongo:
     """Tests for the top-level from_mongo entry point."""
@@ -205,6 +256,48 @@ class TestFromMongo:
         assert len(result.unwrap()) == 1
 
 
+class TestFromMongoParallel:
+    """Tests for from_mongo with parallelism > 1."""
+
+    def _collection(self, n: int) -> FakeCollection:
+        # Stored out of _id order, to show partitions are _id-sorted
+        return FakeCollection([{"_id": i, "n": i} for i in reversed(range(n))])
+
+    def test_partitions_cover_every_document_once(self):
+        result = from_mongo(self._collection(10), {}, schema={"n": int}, parallelism=3)
+
+        assert result.is_ok()
+        assert list(result.unwrap()["n"]) == list(range(10))
+
+    def test_more_partitions_than_documents(self):
+        result = from_mongo(self._collection(2), {}, schema={"n": int}, parallelism=8)
+
+        assert result.is_ok()
+        assert list(result.unwrap()["n"]) == [0, 1]
+
+    def test_limit_caps_partitioned_total(self):
+        result = from_mongo(
+            self._collection(10), {}, schema={"n": int}, limit=4, parallelism=3
+        )
+
+        assert result.is_ok()
+        assert list(result.unwrap()["n"]) == [0, 1, 2, 3]
+
+    def test_empty_collection_returns_empty_dataframe(self):
+        result = from_mongo(FakeCollection([]), {}, schema={"n": int}, parallelism=4)
+
+        assert result.is_ok()
+        assert len(result.unwrap()) == 0
+
+    def test_partition_failure_returns_err(self):
+        collection = FakeCollection([{"_id": 1}], fail_on_iterate=True)
+
+        result = from_mongo(collection, {}, parallelism=2)
+
+        assert result.is_err()
+        assert isinstance(result.unwrap_err(), ConnectionError)
+
+
 class TestFromMongoCursor:
     """Tests for from_mongo_cursor."""
 
@@ -242,6 +335,62 @@ class TestFromMongoCursor:
         df = result.unwrap()
         assert "count" in df.columns
 
+    def test_streams_batches_when_schema_given(self):
+        docs = [{"name": f"user{i}"} for i in range(5)]
+
+        result = from_mongo_cursor(iter(docs), schema={"name": str}, batch_size=2)
+
+        assert result.is_ok()
+        assert list(result.unwrap()["name"]) == [d["name"] for d in docs]
+
+    def test_failure_mid_stream_returns_err(self):
+        def cursor():
+            yield {"name": "Alice"}
+            raise TimeoutError("cursor timed out")
+
+        result = from_mongo_cursor(cursor(), schema={"name": str}, batch_size=1)
+
+        assert result.is_err()
+        assert isinstance(result.unwrap_err(), TimeoutError)
+
+    def test_failure_mid_stream_is_logged_as_iteration_failure(self, monkeypatch):
+        logged = []
+        monkeypatch.setattr(
+            "logerr.recipes.dataframes.mongo.log",
+            lambda message, **kwargs: logged.append(message),
+        )
+
+        def cursor():
+            yield {"name": "Alice"}
+            raise TimeoutError("cursor timed out")
+
+        from_mongo_cursor(cursor(), schema={"name": str}, batch_size=1)
+
+        assert any(m.startswith("Failed to iterate MongoDB cursor") for m in logged)
+
+    def test_conversion_errors_are_not_reported_as_iteration_failures(
+        self, monkeypatch
+    ):
+        logged = []
+        monkeypatch.setattr(
+            "logerr.recipes.dataframes.mongo.log",
+            lambda message, **kwargs: logged.append(message),
+        )
+
+        def broken_conversion(*args, **kwargs):
+            raise RuntimeError("conversion bug")
+
+        monkeypatch.setattr(
+            "logerr.recipes.dataframes.mongo.convert_documents_to_columns",
+            broken_conversion,
+        )
+
+        with pytest.raises(RuntimeError, match="conversion bug"):
+            from_mongo_cursor([{"name": "Alice"}], schema={"name": str})
+        with pytest.raises(RuntimeError, match="conversion bug"):
+            from_mongo(FakeCollection([{"name": "Alice"}]), {}, schema={"name": str})
+        assert not any("MongoDB" in m for m in logged)
+
     def test_plain_list_as_cursor(self):
         # A plain list also satisfies "iterable of documents".
         result = from_mongo_cursor([{"a": 1}], schema={"a": int})
@@ -329,15 +478,21 @@ class TestDocumentsToDataframe:
 class FakePolarsDataFrame:
     """Minimal stand-in for polars.DataFrame."""
 
-    def __init__(self, data=None, schema=None):
+    def __init__(self, data=None, schema=None, schema_overrides=None):
+        if schema_overrides and "reject" in schema_overrides:
+            raise TypeError("schema rejected")
         self.data = data
         self.schema = schema
+        self.schema_overrides = schema_overrides
 
 
 def _install_fake_polars(monkeypatch) -> None:
     """Inject a minimal fake `polars` module into sys.modules."""
     fake_polars = types.ModuleType("polars")
     fake_polars.DataFrame = FakePolarsDataFrame  # type: ignore[attr-defined]
+    fake_polars.exceptions = types.SimpleNamespace(  # type: ignore[attr-defined]
+        PolarsError=type("PolarsError", (Exception,), {})
+    )
     for dtype_name in (
         "Utf8",
         "Int64",
@@ -375,9 +530,69 @@ class TestCreateDataframeFromRows:
         assert isinstance(df, pd.DataFrame)
         assert len(df) == 1
 
-    def test_polars_backend_missing_dependency_raises_import_error(self):
-        # polars is not installed in this environment, so the dispatch to
-        # _create_polars_dataframe should surface a clear ImportError.
+    def test_pandas_dtype_failure_still_converts_other_columns(self):
+        schema_fields = [
+            FieldSpec(name="name", field_type=str, is_required=False),
+            FieldSpec(name="count", field_type=int, is_required=False),
+        ]
+        rows = [{"name": "Alice", "count": {"nested": "dict"}}]
+
+        df = _create_dataframe_from_rows(rows, schema_fields, "pandas")
+
+        assert str(df["name"].dtype) == "string"
+        assert df["count"].dtype == object
+
+    def test_pandas_backend_from_columns_uses_nullable_dtypes(self):
+        schema_fields = [
+            FieldSpec(name="name", field_type=str, is_required=False),
+            FieldSpec(name="age", field_type=int, is_required=False),
+        ]
+        columns = {"name": ["Alice", "Bob"], "age": [30, None]}
+
+        df = _create_dataframe_from_rows(columns, schema_fields, "pandas")
+
+        assert list(df.columns) == ["name", "age"]
+        assert str(df["name"].dtype) == "string"
+        assert str(df["age"].dtype) == "Int64"
+        assert df["age"].isna().tolist() == [False, True]
+
+    @pytest.mark.parametrize(
+        ("field_type", "values"),
+        [
+            (int, [1, None, -3, True]),
+            (float, [1.5, None, float("nan"), 2.0]),
+            (bool, [True, None, False, False]),
+        ],
+    )
+    def test_pandas_masked_columns_match_pd_array(self, field_type, values):
+        schema_fields = [FieldSpec(name="x", field_type=field_type, is_required=False)]
+        dtype = schema_fields[0].pandas_dtype
+
+        df = _create_dataframe_from_rows({"x": values}, schema_fields, "pandas")
+
+        assert df["x"].array.equals(pd.array(values, dtype=dtype))
+
+    def test_pandas_int_column_out_of_int64_range_falls_back(self):
+        schema_fields = [FieldSpec(name="big", field_type=int, is_required=False)]
+
+        df = _create_dataframe_from_rows({"big": [2**70, 1]}, schema_fields, "pandas")
+
+        assert df["big"].dtype == object
+        assert df["big"].tolist() == [2**70, 1]
+
+    def test_pandas_column_dtype_failure_is_logged_not_raised(self):
+        schema_fields = [FieldSpec(name="count", field_type=int, is_required=False)]
+        columns = {"count": [{"nested": "dict"}]}
+
+        df = _create_dataframe_from_rows(columns, schema_fields, "pandas")
+
+        assert len(df) == 1
+        assert df["count"].dtype == object
+
+    def test_polars_backend_missing_dependency_raises_import_error(self, monkeypatch):
+        # Without polars, the dispatch to _create_polars_dataframe should
+        # surface a clear ImportError.
+        monkeypatch.setitem(sys.modules, "polars", None)
         with pytest.raises(ImportError, match="polars is required"):
             _create_dataframe_from_rows([{"name": "Alice"}], [], "polars")
 
@@ -389,6 +604,57 @@ class TestCreateDataframeFromRows:
 
         assert isinstance(df, FakePolarsDataFrame)
         assert df.data == [{"name": "Alice"}]
+        assert df.schema_overrides == {"name": "Utf8"}
+
+    def test_polars_backend_with_columns_uses_schema(self, monkeypatch):
+        _install_fake_polars(monkeypatch)
+        schema_fields = [FieldSpec(name="age", field_type=int, is_required=False)]
+
+        df = _create_dataframe_from_rows({"age": [1, None]}, schema_fields, "polars")
+
+        assert df.data == {"age": [1, None]}
+        assert df.schema_overrides == {"age": "Int64"}
+
+    def test_polars_backend_schema_failure_falls_back_to_inference(self, monkeypatch):
+        _install_fake_polars(monkeypatch)
+        schema_fields = [FieldSpec(name="reject", field_type=int, is_required=False)]
+
+        df = _create_dataframe_from_rows({"reject": [1]}, schema_fields, "polars")
+
+        assert df.data == {"reject": [1]}
+        assert df.schema_overrides is None
+
+    def test_polars_backend_leaves_nested_fields_to_inference(self, monkeypatch):
+        _install_fake_polars(monkeypatch)
+        schema_fields = [
+            FieldSpec(name="age", field_type=int, is_required=False),
+            FieldSpec(name="meta", field_type=dict, is_required=False),
+            FieldSpec(name="tags", field_type=list, is_required=False),
+            FieldSpec(name="blob", field_type=bytes, is_required=False),
+        ]
+        rows = {"age": [1], "meta": [{"x": 1}], "tags": [[1]], "blob": [b"x"]}
+
+        df = _create_dataframe_from_rows(rows, schema_fields, "polars")
+
+        assert df.schema_overrides == {"age": "Int64"}
+
+    def test_polars_backend_infers_struct_and_list_dtypes(self):
+        pl = pytest.importorskip("polars")
+        schema_fields = [
+            FieldSpec(name="age", field_type=int, is_required=False),
+            FieldSpec(name="meta", field_type=dict, is_required=False),
+            FieldSpec(name="tags", field_type=list, is_required=False),
+        ]
+        rows = [
+            {"age": 1, "meta": {"x": 1}, "tags": [1, 2]},
+            {"age": None, "meta": {"x": 2}, "tags": [3]},
+        ]
+
+        df = _create_dataframe_from_rows(rows, schema_fields, "polars")
+
+        assert df.schema["age"] == pl.Int64
+        assert df.schema["meta"] == pl.Struct({"x": pl.Int64})
+        assert df.schema["tags"] == pl.List(pl.Int64)
 
     def test_polars_backend_empty_rows_builds_schema(self, monkeypatch):
         _install_fake_polars(monkeypatch)
@@ -434,9 +700,10 @@ class TestCreateEmptyDataframe:
         assert result.is_ok()
         assert "user_id" in result.unwrap().columns
 
-    def test_no_schema_polars_missing_dependency_returns_err(self):
-        # polars is not installed here, so the "no schema" polars branch
-        # should surface the ImportError wrapped in an Err via execute().
+    def test_no_schema_polars_missing_dependency_returns_err(self, monkeypatch):
+        # Without polars, the "no schema" polars branch should surface the
+        # ImportError wrapped in an Err via execute().
+        monkeypatch.setitem(sys.modules, "polars", None)
         result = _create_empty_dataframe(None, "polars")
         assert result.is_err()
         assert isinstance(result.unwrap_err(), ImportError)
@@ -297,11 +297,71 @@ class TestDataQualityTracker:
         assert tracker.field_invalid_values["age"][0] == "bad0"
         assert tracker.field_invalid_values["age"][-1] == "bad9"
 
+    def test_record_documents_matches_per_document_recording(self):
+        docs = [{"a": 1, "b": None}, {"a": 2}, {"b": "x"}]
+        single = DataQualityTracker("op")
+        bulk = DataQualityTracker("op")
+
+        for doc in docs:
+            single.record_document(doc)
+        bulk.record_documents(3, {"a": 2, "b": 1, "c": 0})
+
+        assert bulk.total_records == single.total_records
+        assert bulk.field_presence == single.field_presence
+
+    def test_record_conversion_errors_matches_per_value_recording(self):
+        single = DataQualityTracker("op")
+        bulk = DataQualityTracker("op")
+        values = [f"bad{i}" for i in range(15)]
+        errors = [ValueError(v) for v in values]
+
+        for value, error in zip(values, errors, strict=True):
+            single.record_conversion_error("age", value, error)
+        bulk.record_conversion_errors("age", values, errors)
+
+        assert bulk.field_conversion_errors == single.field_conversion_errors
+        assert bulk.field_invalid_values == single.field_invalid_values
+
+    def test_record_conversion_errors_empty_batch_is_noop(self):
+        tracker = DataQualityTracker("op")
+        tracker.record_conversion_errors("age", [], [])
+        assert "age" not in tracker.field_conversion_errors
+
     def test_record_missing_required_field_does_not_raise(self):
         tracker = DataQualityTracker("op")
         tracker.record_missing_required_field("user_id", document_id="abc123")
         tracker.record_missing_required_field("user_id")
 
+    def test_logging_disabled_skips_formatting_but_still_counts(self):
+        from logerr import configure, reset_config
+
+        class Unprintable:
+            def __str__(self):
+                raise AssertionError("value formatted while logging is disabled")
+
+        tracker = DataQualityTracker("op")
+        configure(enabled=False)
+        try:
+            tracker.record_conversion_error("count", Unprintable(), ValueError("x"))
+            tracker.record_conversion_errors(
+                "count", [Unprintable()], [ValueError("x")]
+            )
+            tracker.record_failed_conversion("reason")
+            tracker.record_missing_required_field("user_id")
+        finally:
+            reset_config()
+
+        assert tracker.field_conversion_errors["count"] == 2
+        assert len(tracker.field_invalid_values["count"]) == 2
+        assert tracker.failed_records == 1
+
+    def test_record_successful_conversion_with_count(self):
+        tracker = DataQualityTracker("op")
+        tracker.record_successful_conversion()
+        tracker.record_successful_conversion(5)
+
+        assert tracker.successful_records == 6
+
     def test_generate_report_basic_counts(self):
         tracker = DataQualityTracker("op")
         tracker.record_document({"name": "Alice"})
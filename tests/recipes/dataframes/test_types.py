@@ -80,6 +80,23 @@ class TestFieldSpec:
         assert spec.is_required is False
         assert spec.default_value is None
 
+    def test_fieldspec_is_frozen(self):
+        """Test that FieldSpec instances are immutable and slotted."""
+        spec = FieldSpec(name="age", field_type=int, is_required=False)
+
+        with pytest.raises(AttributeError):
+            spec.is_required = True  # type: ignore[misc]
+        assert not hasattr(spec, "__dict__")
+
+    def test_fieldspec_dtypes_precomputed(self):
+        """Test that dtypes are derived from field_type at construction."""
+        spec = FieldSpec(name="age", field_type=int, is_required=False)
+
+        assert spec.pandas_dtype == "Int64"
+        assert spec.polars_dtype == "Int64"
+        assert spec == FieldSpec(name="age", field_type=int, is_required=False)
+        assert "pandas_dtype" not in repr(spec)
+
     def test_from_schema_entry_required_instance(self):
         """Test from_schema_entry with Required instance."""
         req_type = Required(str)
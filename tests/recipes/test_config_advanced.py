@@ -3,9 +3,12 @@ Comprehensive tests for logerr.recipes.config advanced configuration.
 """
 
 import tempfile
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from logerr.recipes.config import (
     AdvancedLoggingConfig,
     configure_advanced,
@@ -51,6 +54,25 @@ class TestAdvancedLoggingConfig:
         assert config.libraries == {"mylib": {"level": "DEBUG"}}
         assert config.capture_locals is True
 
+    def test_config_is_immutable(self):
+        """Test that configs can't be mutated in place (use configure_advanced)."""
+        config = AdvancedLoggingConfig()
+
+        with pytest.raises(FrozenInstanceError):
+            config.level = "DEBUG"  # type: ignore[misc]
+
+    def test_config_libraries_are_read_only(self):
+        """Test that the libraries table can't be edited behind the config's back."""
+        libraries = {"mylib": {"level": "DEBUG"}}
+        config = AdvancedLoggingConfig(libraries=libraries)
+        libraries["mylib"]["level"] = "INFO"
+
+        with pytest.raises(TypeError):
+            config.libraries["otherlib"] = {}  # type: ignore[index]
+        with pytest.raises(TypeError):
+            config.libraries["mylib"]["level"] = "INFO"  # type: ignore[index]
+        assert config.libraries == {"mylib": {"level": "DEBUG"}}
+
 
 class TestAdvancedConfigManagement:
     """Tests for advanced config management functions."""
@@ -59,14 +81,12 @@ class TestAdvancedConfigManagement:
         """Reset config before each test."""
         reset_advanced_config()
 
-    def test_get_advanced_config_creates_default(self):
-        """Test that get_advanced_config creates default when none exists."""
-        # Reset internal state
+    def test_get_advanced_config_returns_default(self):
+        """Test that get_advanced_config returns the eagerly created default."""
         import logerr.recipes.config as config_module
 
-        config_module._advanced_config = None
-
         config = get_advanced_config()
+        assert config is config_module._advanced_config
         assert isinstance(config, AdvancedLoggingConfig)
         assert config.enabled is True
         assert config.level == "ERROR"
@@ -119,6 +139,31 @@ class TestAdvancedConfigManagement:
         assert "Invalid log level" in str(error)
         assert "INVALID_LEVEL" in str(error)
 
+    @pytest.mark.parametrize("level", [["DEBUG"], {"DEBUG": 1}, 10, None])
+    def test_configure_advanced_non_string_level_returns_err(self, level):
+        """Test that a non-string level (e.g. from a config file) is an Err."""
+        result = configure_advanced({"level": level})
+
+        assert result.is_err()
+        assert isinstance(result.unwrap_err(), ValueError)
+        assert "Invalid log level" in str(result.unwrap_err())
+
+    @pytest.mark.parametrize("libraries", [5, "mylib", ["mylib"]])
+    def test_configure_advanced_malformed_libraries_returns_err(self, libraries):
+        """Test that a non-mapping libraries value is an Err, not an exception."""
+        result = configure_advanced({"libraries": libraries})
+
+        assert result.is_err()
+        assert isinstance(result.unwrap_err(), ValueError)
+        assert get_advanced_config().libraries == {}
+
+    def test_configure_advanced_malformed_library_settings_returns_err(self):
+        """Test that a non-mapping entry for one library is an Err."""
+        result = configure_advanced({"libraries": {"mylib": 5}})
+
+        assert result.is_err()
+        assert isinstance(result.unwrap_err(), ValueError)
+
     def test_configure_advanced_partial_update(self):
         """Test that configure_advanced performs partial updates."""
         # Set initial config
@@ -132,6 +177,28 @@ class TestAdvancedConfigManagement:
         assert config.level == "DEBUG"
         assert config.enabled is False  # Should preserve previous value
 
+    def test_configure_advanced_without_changes_keeps_config(self):
+        """Test that a no-op configure_advanced keeps the same config object."""
+        configure_advanced({"level": "WARNING", "libraries": {"lib": {"x": 1}}})
+        before = get_advanced_config()
+
+        assert configure_advanced({}).is_ok()
+        assert configure_advanced({"level": "WARNING", "enabled": True}).is_ok()
+        assert configure_advanced({"libraries": {"lib": {"x": 1}}}).is_ok()
+        assert get_advanced_config() is before
+
+        assert configure_advanced({"enabled": False}).is_ok()
+        assert get_advanced_config() is not before
+
+    def test_configure_advanced_ignores_unknown_keys(self):
+        """Test that keys which aren't config fields are ignored."""
+        result = configure_advanced({"enabled": False, "not_a_field": 123})
+        assert result.is_ok()
+
+        config = get_advanced_config()
+        assert config.enabled is False
+        assert not hasattr(config, "not_a_field")
+
     def test_configure_advanced_merges_libraries(self):
         """Test that library configs are merged, not replaced."""
         # Set initial libraries
@@ -148,8 +215,8 @@ class TestAdvancedConfigManagement:
 
     def test_configure_advanced_exception_handling(self):
         """Test configure_advanced handles exceptions in config creation."""
-        with patch("logerr.recipes.config.AdvancedLoggingConfig") as mock_config:
-            mock_config.side_effect = RuntimeError("Config creation failed")
+        with patch("logerr.recipes.config.replace") as mock_replace:
+            mock_replace.side_effect = RuntimeError("Config creation failed")
 
             result = configure_advanced({"level": "WARNING"})
             assert result.is_err()
@@ -245,7 +312,7 @@ level = "INVALID_LEVEL"
 
     def test_configure_from_confection_file_read_error(self):
         """Test handling of file read errors."""
-        with patch("logerr.recipes.config.Config") as mock_config_class:
+        with patch("confection.Config") as mock_config_class:
             mock_config = MagicMock()
             mock_config.from_disk.side_effect = OSError("Permission denied")
             mock_config_class.return_value = mock_config
@@ -261,6 +328,34 @@ level = "INVALID_LEVEL"
             finally:
                 Path(config_path).unlink()
 
+    def test_configure_from_confection_reparses_only_when_file_changes(self):
+        """Test that an unchanged file is not re-parsed on repeated loads."""
+        from confection import Config
+
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".cfg", delete=False) as f:
+            f.write('[logerr]\nlevel = "WARNING"\n')
+            config_path = f.name
+
+        try:
+            with patch.object(
+                Config, "from_disk", autospec=True, side_effect=Config.from_disk
+            ) as mock_from_disk:
+                assert configure_from_confection(config_path).is_ok()
+                configure_advanced({"level": "ERROR"})
+                assert configure_from_confection(config_path).is_ok()
+
+                # Cached section is still applied, but the file isn't re-read
+                assert get_advanced_config().level == "WARNING"
+                assert mock_from_disk.call_count == 1
+
+                Path(config_path).write_text('[logerr]\nlevel = "CRITICAL"\n')
+                assert configure_from_confection(config_path).is_ok()
+
+                assert get_advanced_config().level == "CRITICAL"
+                assert mock_from_disk.call_count == 2
+        finally:
+            Path(config_path).unlink()
+
 
 class TestLibrarySpecificConfig:
     """Tests for library-specific configuration functions."""
@@ -338,6 +433,34 @@ class TestLibrarySpecificConfig:
         assert isinstance(level, str)
         assert level == "123"
 
+    def test_library_lookups_track_reconfiguration(self):
+        """Test that resolved library lookups are rebuilt on reconfigure."""
+        configure_advanced({"libraries": {"mylib": {"level": "DEBUG"}}})
+        assert get_log_level_for_library("mylib") == "DEBUG"
+        assert should_log_for_library("mylib") is True
+
+        configure_advanced(
+            {"libraries": {"mylib": {"level": "WARNING", "enabled": False}}}
+        )
+        assert get_log_level_for_library("mylib") == "WARNING"
+        assert should_log_for_library("mylib") is False
+
+        reset_advanced_config()
+        assert get_log_level_for_library("mylib") == "ERROR"
+        assert get_library_config("mylib") == {}
+
+    def test_unconfigured_libraries_follow_global_settings(self):
+        """Test that libraries without an entry pick up later global changes."""
+        configure_advanced({"libraries": {"mylib": {"level": "DEBUG"}}})
+        configure_advanced({"level": "CRITICAL"})
+
+        assert get_log_level_for_library("mylib") == "DEBUG"
+        assert get_log_level_for_library("otherlib") == "CRITICAL"
+
+        configure_advanced({"enabled": False})
+        assert should_log_for_library("mylib") is False
+        assert should_log_for_library("otherlib") is False
+
 
 class TestCoreConfigSync:
     """Tests for synchronizing core config with advanced config."""
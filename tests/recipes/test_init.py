@@ -3,6 +3,8 @@ Tests for logerr.recipes.__init__ module import handling.
 """
 
 import importlib
+import importlib.util
+import subprocess
 import sys
 import warnings
 from unittest.mock import patch
@@ -63,14 +65,21 @@ class TestRecipesImports:
 
     def test_recipes_imports_without_tenacity(self):
         """Test recipes module behavior when tenacity is missing."""
-        # Mock the import to fail for tenacity (used by retry module)
+        # Mock the import to fail for tenacity (used by retry module), and hide
+        # it from the up-front availability check
         original_import = __import__
+        original_find_spec = importlib.util.find_spec
 
         def mock_import(name, *args, **kwargs):
             if "tenacity" in name or (name == "logerr.recipes.retry"):
                 raise ImportError("No module named 'tenacity'")
             return original_import(name, *args, **kwargs)
 
+        def mock_find_spec(name, *args, **kwargs):
+            if name == "tenacity":
+                return None
+            return original_find_spec(name, *args, **kwargs)
+
         # Clear any cached imports (except core ones we want to keep)
         modules_to_clear = [
             key for key in sys.modules if key.startswith("logerr.recipes")
@@ -81,6 +90,7 @@ class TestRecipesImports:
 
         with (
             patch("builtins.__import__", side_effect=mock_import),
+            patch("importlib.util.find_spec", side_effect=mock_find_spec),
             warnings.catch_warnings(record=True) as w,
         ):
             warnings.simplefilter("always")
@@ -98,6 +108,19 @@ class TestRecipesImports:
             # Should not have retry in __all__
             assert "retry" not in logerr.recipes.__all__
             assert "config" in logerr.recipes.__all__
+            assert not hasattr(logerr.recipes, "retry")
+
+    def test_retry_is_imported_lazily(self):
+        """Test that importing recipes defers the retry module to first access."""
+        code = (
+            "import sys, logerr.recipes; "
+            "assert 'logerr.recipes.retry' not in sys.modules; "
+            "assert 'tenacity' not in sys.modules; "
+            "assert logerr.recipes.retry.on_err; "
+            "assert 'logerr.recipes.retry' in sys.modules; "
+            "assert 'retry' in dir(logerr.recipes)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
 
     def test_recipes_imports_without_dataframes_deps(self):
         """Test recipes module behavior when dataframes dependencies are missing."""
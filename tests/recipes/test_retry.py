@@ -1,5 +1,6 @@
 """Tests for retry functionality."""
 
+import asyncio
 import time
 from unittest.mock import patch
 
@@ -415,6 +416,58 @@ class TestRetryDecorators:
         result4 = decorated_func(-5, -10)
         assert result3.is_err() == result4.is_err()
 
+    def test_default_stop_resolved_once_per_decoration(self):
+        """Test that a default stop is built at decoration, not per call."""
+        with patch.object(
+            retry, "stop_after_attempt", wraps=retry.stop_after_attempt
+        ) as mock_stop:
+
+            @retry.on_err_type(ValueError, wait=wait_fixed(0), log_attempts=False)
+            def succeed() -> Result[int, Exception]:
+                return Ok(1)
+
+            for _ in range(3):
+                assert succeed().unwrap() == 1
+
+        assert mock_stop.call_count == 1
+
+    def test_default_schedule_does_not_use_tenacity(self):
+        """Test that decorators without stop/wait run a plain retry loop."""
+        calls = []
+
+        @retry.on_err(log_attempts=False)
+        def flaky() -> Result[int, str]:
+            calls.append(1)
+            return Err("failed") if len(calls) < 3 else Ok(42)
+
+        with (
+            patch.object(retry, "Retrying", side_effect=AssertionError) as retrying,
+            patch.object(retry.time, "sleep") as mock_sleep,
+        ):
+            result = flaky()
+
+        assert result.unwrap() == 42
+        assert len(calls) == 3
+        retrying.assert_not_called()
+        # tenacity's wait_exponential(multiplier=1, min=4, max=10)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [4.0, 4.0]
+
+    def test_custom_schedule_retries_err_results_without_raising(self):
+        """Test that tenacity retries on a failed result rather than an exception."""
+        calls = []
+
+        @retry.on_err(
+            stop=stop_after_attempt(3), wait=wait_fixed(0), log_attempts=False
+        )
+        def flaky() -> Result[int, str]:
+            calls.append(1)
+            return Err("failed")
+
+        result = flaky()
+
+        assert result.is_err()
+        assert len(calls) == 3
+
 
 class TestRetryUtilities:
     """Test retry utility functions."""
@@ -627,6 +680,63 @@ class TestRetryUtilities:
         assert result.unwrap_err() == "always fails"
         assert call_count == 2
 
+    def test_backoff_schedule_matches_tenacity(self):
+        """Test that with_retry waits as wait_exponential(delay, delay, 30)."""
+
+        def always_fails():
+            raise ValueError("nope")
+
+        with patch.object(retry.time, "sleep") as mock_sleep:
+            result = retry.with_retry(
+                always_fails, max_attempts=7, delay=2.0, log_attempts=False
+            )
+
+        assert result.is_err()
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [
+            2.0,
+            4.0,
+            8.0,
+            16.0,
+            30.0,
+            30.0,
+        ]
+
+    def test_wait_schedule_is_computed_once(self):
+        """Test that backoff schedules are cached per argument combination."""
+        schedule = retry._wait_schedule(6, 1.0, 1.0, 10.0)
+
+        assert schedule == (1.0, 2.0, 4.0, 8.0, 10.0)
+        assert retry._wait_schedule(6, 1.0, 1.0, 10.0) is schedule
+        assert retry._wait_schedule(1, 1.0, 1.0, 10.0) == ()
+
+    def test_fixed_delay_schedule(self):
+        """Test that backoff=False waits the same delay between attempts."""
+        with patch.object(retry.time, "sleep") as mock_sleep:
+            retry.until_ok(
+                lambda: Err("nope"),
+                max_attempts=3,
+                delay=0.5,
+                backoff=False,
+                log_attempts=False,
+            )
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.5]
+
+    def test_until_ok_retries_raised_exceptions(self):
+        """Test that an exception raised by func counts as a failed attempt."""
+        calls = []
+
+        def flaky() -> Result[int, str]:
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return Ok(7)
+
+        result = retry.until_ok(flaky, delay=0.01, log_attempts=False)
+
+        assert result.unwrap() == 7
+        assert len(calls) == 2
+
 
 class TestConvenienceFunctions:
     """Test convenience retry functions."""
@@ -818,6 +928,30 @@ class TestLogging:
         assert not mock_logger.info.called
         assert not mock_logger.warning.called
 
+    def test_filtered_log_messages_are_not_formatted(self):
+        """Test that attempt messages are only formatted when they get logged."""
+        from loguru import logger
+
+        formatted = []
+
+        class Failure:
+            def __str__(self):
+                formatted.append(1)
+                return "failure"
+
+        @retry.on_err(stop=stop_after_attempt(2), wait=wait_fixed(0), log_attempts=True)
+        def failing() -> Result[int, Failure]:
+            return Err(Failure())
+
+        logger.disable("logerr.recipes.retry")
+        try:
+            with patch("logerr.result.should_log", return_value=False):
+                failing()
+        finally:
+            logger.enable("logerr.recipes.retry")
+
+        assert formatted == []
+
 
 class TestErrorHandling:
     """Test error handling in retry scenarios."""
@@ -885,3 +1019,177 @@ class TestErrorHandling:
         # The retry mechanism returns a generic error message when all attempts fail
         assert "All retry attempts failed" in str(result.unwrap_err())
         assert call_count == 2
+
+
+class TestAsyncRetry:
+    """Test the async retry variants."""
+
+    def test_aon_err_retries_until_ok(self):
+        calls = []
+
+        @retry.aon_err(stop=stop_after_attempt(3), wait=wait_fixed(0.01))
+        async def flaky() -> Result[int, str]:
+            calls.append(1)
+            return Err("failed") if len(calls) < 2 else Ok(42)
+
+        assert asyncio.run(flaky()).unwrap() == 42
+        assert len(calls) == 2
+
+    def test_aon_err_default_schedule_uses_asyncio_sleep(self):
+        @retry.aon_err(log_attempts=False)
+        async def always_fails() -> Result[int, str]:
+            return Err("failed")
+
+        waits = []
+
+        async def fake_sleep(seconds: float) -> None:
+            waits.append(seconds)
+
+        with (
+            patch.object(retry.asyncio, "sleep", fake_sleep),
+            patch.object(retry.time, "sleep") as blocking_sleep,
+        ):
+            result = asyncio.run(always_fails())
+
+        assert result.unwrap_err() == "failed"
+        assert waits == [4.0, 4.0]
+        blocking_sleep.assert_not_called()
+
+    def test_aon_err_type_returns_non_retryable_error(self):
+        calls = []
+
+        @retry.aon_err_type(ConnectionError, wait=wait_fixed(0), log_attempts=False)
+        async def fails() -> Result[int, Exception]:
+            calls.append(1)
+            return Err(ValueError("bad input"))
+
+        result = asyncio.run(fails())
+
+        assert isinstance(result.unwrap_err(), ValueError)
+        assert len(calls) == 1
+
+    def test_awith_retry_catches_exceptions(self):
+        calls = []
+
+        async def flaky() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("down")
+            return "ok"
+
+        result = asyncio.run(retry.awith_retry(flaky, delay=0.01, log_attempts=False))
+
+        assert result.unwrap() == "ok"
+        assert len(calls) == 3
+
+    def test_awith_retry_all_attempts_fail(self):
+        async def down() -> str:
+            raise ConnectionError("down")
+
+        result = asyncio.run(
+            retry.awith_retry(down, max_attempts=2, delay=0.01, log_attempts=False)
+        )
+
+        assert isinstance(result.unwrap_err(), ConnectionError)
+
+    def test_auntil_ok_returns_last_err(self):
+        async def always_fails() -> Result[int, str]:
+            return Err("still failing")
+
+        result = asyncio.run(
+            retry.auntil_ok(
+                always_fails, max_attempts=2, delay=0.01, log_attempts=False
+            )
+        )
+
+        assert result.unwrap_err() == "still failing"
+
+    def test_waits_do_not_block_other_tasks(self):
+        """Test that concurrent retries back off concurrently."""
+
+        async def always_fails() -> Result[int, str]:
+            return Err("failed")
+
+        async def main() -> float:
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    retry.auntil_ok(
+                        always_fails,
+                        max_attempts=2,
+                        delay=0.1,
+                        backoff=False,
+                        log_attempts=False,
+                    )
+                    for _ in range(10)
+                )
+            )
+            return time.perf_counter() - start
+
+        assert asyncio.run(main()) < 0.5
+
+    @pytest.mark.parametrize(
+        ("sync_helper", "async_name"),
+        [
+            (lambda f: retry.on_err()(f), "aon_err"),
+            (lambda f: retry.on_err_type(ValueError)(f), "aon_err_type"),
+            (lambda f: retry.with_retry(f), "awith_retry"),
+            (lambda f: retry.until_ok(f), "auntil_ok"),
+        ],
+    )
+    def test_sync_helpers_reject_coroutine_functions(self, sync_helper, async_name):
+        async def coroutine_function() -> Result[int, str]:
+            return Ok(1)
+
+        with pytest.raises(TypeError, match=async_name):
+            sync_helper(coroutine_function)
+
+    ASYNC_HELPERS = (
+        (lambda f: asyncio.run(retry.aon_err()(f)()), "on_err"),
+        (
+            lambda f: asyncio.run(
+                retry.aon_err(stop=stop_after_attempt(3), wait=wait_fixed(0))(f)()
+            ),
+            "on_err",
+        ),
+        (lambda f: asyncio.run(retry.aon_err_type(ValueError)(f)()), "on_err_type"),
+        (lambda f: asyncio.run(retry.awith_retry(f)), "with_retry"),
+        (lambda f: asyncio.run(retry.auntil_ok(f)), "until_ok"),
+    )
+
+    @pytest.mark.parametrize(("async_helper", "sync_name"), ASYNC_HELPERS)
+    def test_async_helpers_reject_sync_functions(self, async_helper, sync_name):
+        calls = []
+
+        def sync_function() -> Result[int, str]:
+            calls.append(1)
+            return Ok(1)
+
+        with (
+            patch.object(retry.asyncio, "sleep") as mock_sleep,
+            pytest.raises(TypeError, match=f"use {sync_name} "),
+        ):
+            async_helper(sync_function)
+        mock_sleep.assert_not_called()
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize(("async_helper", "sync_name"), ASYNC_HELPERS)
+    def test_async_helpers_accept_lambdas_returning_coroutines(
+        self, async_helper, sync_name
+    ):
+        async def fetch() -> Result[int, str]:
+            return Ok(42)
+
+        result = async_helper(lambda: fetch())
+
+        assert result.is_ok()
+
+    @pytest.mark.parametrize(("async_helper", "sync_name"), ASYNC_HELPERS)
+    def test_async_helpers_accept_async_callable_objects(self, async_helper, sync_name):
+        class Fetcher:
+            async def __call__(self) -> Result[int, str]:
+                return Ok(42)
+
+        result = async_helper(Fetcher())
+
+        assert result.is_ok()
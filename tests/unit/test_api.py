@@ -2,6 +2,9 @@
 Tests for the new clean API design.
 """
 
+import subprocess
+import sys
+
 import pytest
 
 import logerr
@@ -88,6 +91,71 @@ class TestCleanAPI:
         reset_config = logerr.get_config()
         assert reset_config.level == "ERROR"  # default
 
+    def test_should_log_tracks_configuration(self):
+        """Test that should_log() follows configure()/reset_config()."""
+        from logerr.config import should_log
+
+        try:
+            logerr.configure(enabled=False)
+            assert should_log() is False
+
+            logerr.configure(level="WARNING")  # enabled left unchanged
+            assert should_log() is False
+
+            logerr.configure(enabled=True)
+            assert should_log() is True
+
+            logerr.configure(enabled=False)
+        finally:
+            logerr.reset_config()
+        assert should_log() is True
+
+    def test_configure_without_changes_keeps_config(self):
+        """Test that configure() with nothing to change is a no-op."""
+        before = logerr.get_config()
+
+        assert logerr.configure().is_ok()
+        assert logerr.configure(enabled=True, level="ERROR").is_ok()
+        assert logerr.get_config() is before
+
+    def test_reset_config_reuses_default_instance(self):
+        """Test that reset_config() doesn't allocate a new default config."""
+        from logerr.config import LoggingConfig
+
+        logerr.configure(level="DEBUG")
+        logerr.reset_config()
+        first = logerr.get_config()
+
+        logerr.configure(level="DEBUG")
+        logerr.reset_config()
+        assert logerr.get_config() is first
+        assert first == LoggingConfig()
+
+    def test_top_level_exports_are_lazy(self):
+        """Test that importing logerr defers submodules until first access."""
+        code = (
+            "import sys, logerr; "
+            "assert 'logerr.utilities' not in sys.modules; "
+            "assert logerr.utilities.pipe; "
+            "assert 'logerr.utilities' in sys.modules; "
+            "assert set(logerr.__all__) <= set(dir(logerr))"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_config_submodule_is_reachable(self):
+        """Test that logerr.config resolves without importing it first."""
+        code = (
+            "import sys, logerr; "
+            "assert 'logerr.config' not in sys.modules; "
+            "assert logerr.config.configure is logerr.configure"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown top-level names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = logerr.does_not_exist
+
 
 class TestAPIDocumentation:
     """Test that demonstrates the clean API in action."""
@@ -144,6 +144,16 @@ class TestNothing:
             option.unwrap()
         assert exc_info.value is original
 
+    def test_nothing_empty_is_shared(self):
+        assert Nothing.empty() is Nothing.empty()
+
+    def test_nothing_propagates_itself(self):
+        """map/then/filter on Nothing return the same (immutable) instance."""
+        option = Nothing.from_exception(ValueError("boom"))
+        assert option.map(lambda x: x) is option
+        assert option.then(lambda x: Some(x)) is option
+        assert option.filter(lambda x: True) is option
+
     def test_nothing_ok_or(self):
         from logerr import Err
 
@@ -198,11 +208,18 @@ class TestNothing:
             assert nothing > 5
 
     def test_nothing_ge_some_is_false(self):
-        """Nothing is never >= a Some, hitting Nothing.__ge__'s fallback branch."""
+        """Nothing is never >= a Some."""
         nothing = Nothing.empty()
         some = Some(42)
         assert not (nothing >= some)
 
+    def test_nothing_le_and_ge_incomparable_type(self):
+        nothing = Nothing.empty()
+        with pytest.raises(TypeError):
+            assert nothing <= 5
+        with pytest.raises(TypeError):
+            assert nothing >= 5
+
     def test_nothing_unwrap_or(self):
         option = Nothing("test reason")
         assert option.unwrap_or(42) == 42
@@ -247,6 +264,20 @@ class TestNothing:
         assert isinstance(option, Nothing)
         assert "Exception: test error" in option._reason
 
+    def test_nothing_from_exception_when_logging_disabled(self):
+        exception = ValueError("test error")
+        configure(enabled=False)
+        try:
+            option = Nothing.from_exception(exception)
+        finally:
+            configure(enabled=True)
+
+        assert option == Nothing("Exception: test error")
+        assert hash(option) == hash(Nothing("Exception: test error"))
+        assert repr(option) == "Nothing('Exception: test error')"
+        with pytest.raises(ValueError, match="test error"):
+            option.unwrap()
+
     def test_nothing_from_none(self):
         option = Nothing.from_none("custom reason")
         assert isinstance(option, Nothing)
@@ -270,6 +301,20 @@ class TestOptionFactories:
         option = logerr.option.from_nullable(None)
         assert isinstance(option, Nothing)
 
+    def test_option_from_nullable_nothing_shared_when_logging_disabled(self):
+        configure(enabled=False)
+        try:
+            first = logerr.option.from_nullable(None)
+            assert first is logerr.option.from_nullable(None)
+            assert first == Nothing.from_none()
+        finally:
+            configure(enabled=True)
+
+    def test_option_from_nullable_nothing_logs_when_enabled(self):
+        with patch.object(logger, "bind") as mock_bind:
+            logerr.option.from_nullable(None)
+            mock_bind.assert_called_once()
+
     def test_option_of_some(self):
         option = logerr.option.of(lambda: 42)
         assert isinstance(option, Some)
@@ -549,6 +594,24 @@ class TestOptionDunderMethods:
         d = {Some(1): "one"}
         assert d[Some(1)] == "one"
 
+    def test_some_hash_is_cached(self):
+        class CountingHash:
+            calls = 0
+
+            def __hash__(self):
+                CountingHash.calls += 1
+                return 1
+
+        option = Some(CountingHash())
+        assert hash(option) == hash(option)
+        assert CountingHash.calls == 1
+
+    def test_some_hash_of_unhashable_value_raises(self):
+        option = Some([1, 2])
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                hash(option)
+
     def test_nothing_hash_matches_equal_instances(self):
         assert hash(Nothing.empty()) == hash(Nothing.empty())
 
@@ -591,6 +654,39 @@ class TestOptionDunderMethods:
     def test_nothing_or_dunder_matches_or_method(self):
         assert (Nothing.empty() | Some(2)) == Nothing.empty().or_(Some(2))
 
+    def test_some_le_ge_compare_values_once(self):
+        assert Some(1) <= Some(1)
+        assert Some(1) <= Some(2)
+        assert not Some(2) <= Some(1)
+        assert Some(2) >= Some(1)
+        assert Some(1) >= Nothing.empty()
+        assert not Some(1) <= Nothing.empty()
+
+    def test_some_le_ge_with_values_defining_only_eq_and_lt(self):
+        """Values without <=/>= still order through == and </>."""
+
+        class Version:
+            def __init__(self, n):
+                self.n = n
+
+            def __eq__(self, other):
+                return self.n == other.n
+
+            def __lt__(self, other):
+                return self.n < other.n
+
+            def __hash__(self):
+                return hash(self.n)
+
+        assert Some(Version(1)) <= Some(Version(1))
+        assert Some(Version(1)) <= Some(Version(2))
+        assert Some(Version(2)) >= Some(Version(1))
+
+    def test_instances_use_slots(self):
+        """Some/Nothing carry no per-instance __dict__."""
+        assert not hasattr(Some(1), "__dict__")
+        assert not hasattr(Nothing.empty(), "__dict__")
+
 
 class TestOptionCollectionFactories:
     """Test that Option.sequence/Option.traverse delegate to logerr.itertools."""
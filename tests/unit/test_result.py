@@ -264,6 +264,14 @@ class TestLogging:
         # Reset config
         configure(level="ERROR")
 
+    def test_err_binds_caller_context(self):
+        with patch.object(logger, "bind") as mock_bind:
+            Err("test error")
+
+        _, kwargs = mock_bind.call_args
+        assert kwargs["function"] == "test_err_binds_caller_context"
+        assert kwargs["file"] == "test_result.py"
+
     @pytest.mark.skip(reason="Library-specific config moved to recipes module")
     def test_library_specific_config(self):
         # This test is for advanced configuration features
@@ -442,6 +450,11 @@ class TestResultDunderMethods:
     def test_err_or_dunder_matches_or_method(self):
         assert (Err("primary") | Ok(2)) == Err("primary").or_(Ok(2))
 
+    def test_instances_use_slots(self):
+        """Ok/Err carry no per-instance __dict__."""
+        assert not hasattr(Ok(1), "__dict__")
+        assert not hasattr(Err("boom"), "__dict__")
+
 
 class TestResultCollectionFactories:
     """Test that Result.sequence/Result.traverse delegate to logerr.itertools."""
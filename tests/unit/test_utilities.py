@@ -2,12 +2,15 @@
 Tests for utility functions in logerr.utilities module.
 """
 
+from unittest.mock import patch
+
 import pytest
 
 from logerr import Nothing, Some
 from logerr.utilities import (
     attribute,
     chain,
+    compile_pipe,
     error,
     execute,
     log,
@@ -16,6 +19,7 @@ from logerr.utilities import (
     resolve,
     try_chain,
     validate,
+    validate_many,
 )
 
 pytestmark = pytest.mark.unit
@@ -225,6 +229,55 @@ class TestValidate:
         assert isinstance(result.unwrap_err(), ValueError)
 
 
+class TestValidateMany:
+    """Test the validate_many utility function."""
+
+    def test_validate_many_matches_validate(self):
+        """Test that each result matches validating the value on its own."""
+        values = [3, -1, 0, 7]
+        results = validate_many(values, lambda x: x > 0, error_factory="not positive")
+
+        assert [r.is_ok() for r in results] == [True, False, False, True]
+        assert results[0].unwrap() == 3
+        assert results[1].unwrap_err() == "not positive"
+
+    def test_validate_many_option(self):
+        """Test validate_many with the option return type."""
+        results = validate_many(
+            ["a", ""], bool, error_factory="empty", return_type="option"
+        )
+        assert results[0].unwrap() == "a"
+        assert results[1].is_nothing()
+
+    def test_validate_many_captures_predicate_exceptions(self):
+        """Test that a raising predicate only fails that value."""
+        results = validate_many([4, 0], lambda x: 8 / x > 1, error_factory="small")
+        assert results[0].is_ok()
+        assert isinstance(results[1].unwrap_err(), ZeroDivisionError)
+
+    def test_validate_many_applies_ufunc_to_whole_batch(self):
+        """Test that a ufunc predicate only sends failing values to validate()."""
+        np = pytest.importorskip("numpy")
+        values = [1.0, float("nan"), 2.5, float("inf")]
+
+        with patch("logerr.utilities.validate", wraps=validate) as per_value:
+            results = validate_many(
+                values, np.isfinite, error_factory=lambda v: f"{v} is not finite"
+            )
+
+        assert per_value.call_count == 2
+        assert [r.is_ok() for r in results] == [True, False, True, False]
+        assert type(results[0].unwrap()) is float
+        assert results[3].unwrap_err() == "inf is not finite"
+
+    def test_validate_many_falls_back_when_ufunc_rejects_array(self):
+        """Test that a ufunc failing on the whole array is retried per value."""
+        np = pytest.importorskip("numpy")
+        results = validate_many([1.0, "x"], np.isfinite, error_factory="bad")
+        assert results[0].is_ok()
+        assert isinstance(results[1].unwrap_err(), TypeError)
+
+
 class TestResolveDefaults:
     """Test the resolve utility function."""
 
@@ -267,6 +320,19 @@ class TestAttribute:
         result = attribute(42, "nonexistent", "fallback")
         assert result == "fallback"
 
+    def test_attribute_none_or_raising_uses_default(self):
+        """Test that None values and failing properties fall back to the default."""
+
+        class Thing:
+            name = None
+
+            @property
+            def broken(self):
+                raise ValueError("boom")
+
+        assert attribute(Thing(), "name", "fallback") == "fallback"
+        assert attribute(Thing(), "broken", "fallback") == "fallback"
+
 
 class TestError:
     """Test the error utility function."""
@@ -324,6 +390,37 @@ class TestPipe:
         assert calls == ["start"]  # second `track` never called
 
 
+class TestCompilePipe:
+    """Test the compile_pipe utility function."""
+
+    def test_compile_pipe_matches_pipe(self):
+        """A compiled pipeline gives the same results as pipe()."""
+        steps = (str.strip, str.upper, lambda s: s.split())
+        pipeline = compile_pipe(*steps)
+
+        for value in ["  hello world  ", "a", ""]:
+            assert pipeline(value).unwrap() == pipe(value, *steps).unwrap()
+
+    def test_compile_pipe_no_functions(self):
+        """A pipeline without functions returns its input."""
+        assert compile_pipe()("hello").unwrap() == "hello"
+
+    def test_compile_pipe_short_circuits_on_failure(self):
+        """A raising step returns Err; later steps never run."""
+        calls = []
+
+        def track(x):
+            calls.append(x)
+            return x
+
+        pipeline = compile_pipe(track, int, track)
+
+        assert pipeline("1").unwrap() == 1
+        result = pipeline("nope")
+        assert isinstance(result.unwrap_err(), ValueError)
+        assert calls == ["1", 1, "nope"]
+
+
 class TestTryChain:
     """Test the try_chain utility function."""
 
@@ -350,6 +447,42 @@ class TestTryChain:
         result = try_chain(lambda: 1 / 0, lambda: int("invalid"), lambda: [][0])
         assert result.is_nothing()
 
+    def test_try_chain_guard_skips_callable(self):
+        """Test that a callable whose guard returns False is never called."""
+        calls = []
+
+        def never():
+            calls.append("never")
+            return 0
+
+        result = try_chain((lambda: False, never), (lambda: True, lambda: 42))
+        assert result.unwrap() == 42
+        assert calls == []
+
+    @pytest.mark.parametrize(
+        "item",
+        [
+            (lambda: True,),
+            (lambda: True, lambda: 1, lambda: 2),
+            (True, lambda: 1),
+            (lambda: True, 1),
+            42,
+        ],
+    )
+    def test_try_chain_rejects_malformed_items(self, item):
+        """Test that items other than callables or (guard, callable) pairs raise."""
+        with pytest.raises(TypeError):
+            try_chain(item, lambda: 42)
+
+    def test_try_chain_guarded_callable_can_still_fail(self):
+        """Test that a raising guard or guarded callable falls through."""
+        result = try_chain(
+            (lambda: 1 / 0, lambda: 1),
+            (lambda: True, lambda: int("invalid")),
+            lambda: 42,
+        )
+        assert result.unwrap() == 42
+
 
 class TestChain:
     """Test the chain utility function."""